@@ -5,7 +5,7 @@
 """
 __version__ = '1.0'
 
-import sys, pandastool, pyexceltool, pywinexceltool
+import sys, importlib
 #sys.stdout = open('output.txt', "w", encoding='utf8') # 한글 안깨지게 불러오기
 
 ### Global Value
@@ -14,6 +14,16 @@ save_file_path = r'C:\\Users\\HPUX_CHECKLIST_RESULT.xlsx'
 #sheet_name=['Sheet1','Sheet2','HP_Checklist']
 sheet_name=['HP_Checklist']
 
+# 하위 모듈은 처음 접근할 때 import 한다 (pandas, openpyxl, win32com import 비용을 필요할 때만 지불)
+_submodules = ('pandastool', 'pyexceltool', 'pywinexceltool', 'benchmarktool', 'reporttool', 'profiletool')
+
+def __getattr__(name):
+    if name in _submodules:
+        module = importlib.import_module(name)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # workbook = pyexceltool.load_workbook_with_path(file_path=load_file_path)
 # pyexceltool.show_worksheet_list(workbook)
 # pandastool.show_pandas_option()
@@ -27,13 +37,14 @@ sheet_name=['HP_Checklist']
 #     if selected_df is not None:
 #         print(selected_df.values)
 if __name__ == "__main__":
+    import pandastool, pywinexceltool
     excel = pywinexceltool.create_new_excel_object()
     workbook = pywinexceltool.load_workbook_with_path(excel, file_path=load_file_path)
     df_dict = pywinexceltool.convert_worksheet_to_df(excel, workbook, sheet_name=sheet_name, include_index=False, include_column=False)
     for sheet in sheet_name:
         df = df_dict[sheet]
         pandastool.show_dataframe_info(df)
-        print(df.values)
+        pandastool.show_dataframe(df)
         selected_df = pandastool.select_data_from_df(df,row_list=[3,5])
         if selected_df is not None:
-            print(selected_df.values)
+            pandastool.show_dataframe(selected_df)
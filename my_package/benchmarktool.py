@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+#-*- coding: utf-8 -*-
+"""pyexceltool, pandastool 주요 함수의 성능을 측정하는 benchmark 스크립트
+   ※ 본 문서는 Google Style Python docstring 으로 작성됨
+
+   아래의 기능을 제공한다.
+   지정한 크기(행 x 열 x Sheet)의 임의 데이터(숫자/문자열/날짜 혼합) Excel 파일 생성
+   읽기(load), 변환(convert), 선택(select), 저장(write) 단계별 소요시간, 최대 메모리, 초당 처리 행 수 측정
+   저장 압축 방식/수준(stored, deflate 1, 기본, 9)별 저장 시간과 파일 크기 측정
+   새 python 프로세스에서 pyexceltool import 및 Sheet 목록 조회까지의 시작 시간(cold start) 측정
+   측정 결과를 JSON 파일로 저장하고 이전 버전의 결과와 비교
+
+Note:
+   같은 seed와 크기로 생성한 파일은 항상 같은 내용이므로 버전 간 결과를 비교할 수 있다.
+   최대 메모리는 tracemalloc으로 단계별로 측정하며(peak_traced_bytes),
+   resource 모듈이 있는 OS(Linux/Mac)에서는 측정 시점까지의 프로세스 최대 RSS(process_peak_rss_kb)도 함께 기록한다.
+   process_peak_rss_kb는 프로세스 시작 후 누적 최댓값이므로 단계별 메모리가 아니며, 앞 단계보다 작아지지 않는다.
+   tracemalloc은 실행을 느리게 하므로 소요시간 측정과 별도로 한 번 더 실행하여 측정한다.
+
+Example:
+   10000행 x 10열 x 2 Sheet 파일로 측정하여 결과 저장
+   python benchmarktool.py --rows 10000 --columns 10 --sheets 2 --output bench_new.json
+
+   이전 결과와 비교
+   python benchmarktool.py --rows 10000 --columns 10 --sheets 2 --output bench_new.json --compare bench_old.json
+
+   Sheet 목록 조회 cold start가 0.3초를 넘으면 실패(exit code 1)
+   python benchmarktool.py --max-cold-start-seconds 0.3
+
+
+
+"""
+
+import sys, os, time, json, argparse, platform, tempfile, tracemalloc, datetime, subprocess
+import numpy as np
+import pandas as pd
+import openpyxl
+import pyexceltool, pandastool
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+_COLD_START_CODE = """
+import time
+start = time.perf_counter()
+import pyexceltool
+{body}
+print(time.perf_counter() - start)
+"""
+
+def create_synthetic_df(rows=10000, columns=10, seed=0):
+    """ 숫자/문자열/날짜가 섞인 임의의 DataFrame 생성
+
+    열은 정수, 실수, 반복 문자열(상태값), 고유 문자열, 날짜 순서로 반복된다.
+
+    Args:
+        rows (int, optional): 행 수
+        columns (int, optional): 열 수
+        seed (int, optional): 난수 seed
+
+    Returns:
+        pandas.DataFrame
+
+    """
+    rng = np.random.default_rng(seed)
+    status = np.array(['OK', 'N/A', 'FAIL', 'CHECK'])
+    start = np.datetime64('2021-01-01T00:00:00')
+    datas = dict()
+    for i in range(columns):
+        kind = i % 5
+        if kind == 0:
+            datas[f'int_{i}'] = rng.integers(0, 1000000, rows)
+        elif kind == 1:
+            datas[f'float_{i}'] = rng.random(rows) * 1000
+        elif kind == 2:
+            datas[f'status_{i}'] = status[rng.integers(0, len(status), rows)]
+        elif kind == 3:
+            datas[f'host_{i}'] = [f'host{n:07d}' for n in rng.integers(0, rows, rows)]
+        else:
+            datas[f'date_{i}'] = start + rng.integers(0, 86400 * 365, rows).astype('timedelta64[s]')
+    return pd.DataFrame(datas)
+
+def create_synthetic_workbook(file_path, rows=10000, columns=10, sheets=1, seed=0):
+    """ create_synthetic_df로 만든 DataFrame을 Sheet 수만큼 담은 Excel 파일 생성 (0번 행은 header)
+
+    Args:
+        file_path (str): 생성할 Excel 파일 경로
+        rows (int, optional): Sheet당 행 수
+        columns (int, optional): 열 수
+        sheets (int, optional): Sheet 수
+        seed (int, optional): 난수 seed
+
+    Returns:
+        list (str) : 생성한 Sheet명 목록
+
+    """
+    sheet_name = [f'Sheet{i}' for i in range(sheets)]
+    df_dict = {sheet: create_synthetic_df(rows, columns, seed + i) for i, sheet in enumerate(sheet_name)}
+    pyexceltool.stream_df_to_excel(df_dict, sheet_name=sheet_name, file_path=file_path, include_column=True)
+    return sheet_name
+
+def _peak_rss_kb():
+    """ 프로세스 시작 후 지금까지의 최대 RSS(KB) 반환 (단계별 값이 아님). resource 모듈이 없으면 None
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak # Mac은 byte 단위
+
+def measure(phase, func, rows, repeat=3, trace_memory=True):
+    """ func를 repeat번 실행하여 가장 빠른 소요시간과 메모리 사용량 측정
+
+    Args:
+        phase (str): 측정 단계 이름
+        func (callable): 인자 없이 호출할 측정 대상 함수
+        rows (int): 처리한 전체 행 수 (초당 처리 행 수 계산용)
+        repeat (int, optional): 반복 횟수
+        trace_memory (bool, optional): tracemalloc으로 최대 메모리를 측정할지 여부
+
+    Returns:
+        dict (phase, seconds, rows_per_sec, peak_traced_bytes, process_peak_rss_kb)
+
+    """
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+    peak_traced_bytes = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            func()
+            _, peak_traced_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    best = min(seconds)
+    return {
+        'phase': phase,
+        'seconds': best,
+        'rows_per_sec': rows / best if best > 0 else None,
+        'peak_traced_bytes': peak_traced_bytes,
+        'process_peak_rss_kb': _peak_rss_kb(),
+    }
+
+def measure_cold_start(phase, body, repeat=3):
+    """ 새 python 프로세스에서 pyexceltool import부터 body 실행까지의 시간을 측정
+
+    Args:
+        phase (str): 측정 단계 이름
+        body (str): pyexceltool import 후 실행할 코드
+        repeat (int, optional): 반복 횟수 (가장 빠른 시간을 사용)
+
+    Returns:
+        dict (phase, seconds, rows_per_sec, peak_traced_bytes, process_peak_rss_kb)
+
+    """
+    module_directory = os.path.dirname(os.path.abspath(pyexceltool.__file__))
+    code = _COLD_START_CODE.format(body=body)
+    seconds = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], cwd=module_directory, check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout
+        seconds.append(float(output.strip().splitlines()[-1]))
+    return {'phase': phase, 'seconds': min(seconds), 'rows_per_sec': None, 'peak_traced_bytes': None, 'process_peak_rss_kb': None}
+
+def run_benchmark(rows=10000, columns=10, sheets=1, repeat=3, seed=0, trace_memory=True, work_directory=None):
+    """ 임의의 Excel 파일을 만들어 load, convert, select, write 단계별로 측정
+
+    Args:
+        rows (int, optional): Sheet당 행 수
+        columns (int, optional): 열 수
+        sheets (int, optional): Sheet 수
+        repeat (int, optional): 단계별 반복 횟수
+        seed (int, optional): 난수 seed
+        trace_memory (bool, optional): tracemalloc으로 최대 메모리를 측정할지 여부
+        work_directory (str, optional): 임시 Excel 파일을 만들 폴더. 입력하지 않을 시 임시 폴더
+
+    Returns:
+        dict : 환경 정보(environment), 데이터 크기(shape), 단계별 결과(results)
+
+    """
+    with tempfile.TemporaryDirectory(dir=work_directory) as temp_directory:
+        load_path = os.path.join(temp_directory, 'bench_load.xlsx')
+        save_path = os.path.join(temp_directory, 'bench_save.xlsx')
+        sheet_name = create_synthetic_workbook(load_path, rows, columns, sheets, seed)
+        total_rows = rows * sheets
+
+        workbook = pyexceltool.load_workbook_with_path(load_path)
+        df_dict = pyexceltool.convert_worksheet_to_df(workbook, sheet_name, include_column=True)
+        df = df_dict[sheet_name[0]]
+
+        def read_only_convert():
+            read_only_workbook = pyexceltool.load_workbook_with_path(load_path, read_only=True)
+            pyexceltool.convert_worksheet_to_df(read_only_workbook, sheet_name, include_column=True)
+            read_only_workbook.close()
+
+        def select():
+            pandastool.select_data_from_df(df, column_list=[0, columns - 1])
+            pandastool.select_data_from_df(df, row_list=list(range(0, rows, 2)))
+            pandastool.select_range_data_from_df(df, rows // 4, rows // 2, 1, None)
+
+        phases = [
+            ('load', lambda: pyexceltool.load_workbook_with_path(load_path), total_rows),
+            ('convert', lambda: pyexceltool.convert_worksheet_to_df(workbook, sheet_name, include_column=True), total_rows),
+            ('load_convert_read_only', read_only_convert, total_rows),
+            ('select', select, rows),
+            ('write', lambda: pyexceltool.save_df_to_excel(df_dict, openpyxl.Workbook(), sheet_name, save_path, include_column=True), total_rows),
+            ('write_stream', lambda: pyexceltool.stream_df_to_excel(df_dict, sheet_name, save_path, include_column=True), total_rows),
+            ('write_stored', lambda: pyexceltool.stream_df_to_excel(df_dict, sheet_name, save_path, include_column=True,
+                                                                    compression='stored'), total_rows),
+            ('write_deflate_1', lambda: pyexceltool.stream_df_to_excel(df_dict, sheet_name, save_path, include_column=True,
+                                                                       compress_level=1), total_rows),
+            ('write_deflate_9', lambda: pyexceltool.stream_df_to_excel(df_dict, sheet_name, save_path, include_column=True,
+                                                                       compress_level=9), total_rows),
+        ]
+        results = []
+        for phase, func, phase_rows in phases:
+            result = measure(phase, func, phase_rows, repeat, trace_memory)
+            result['file_bytes'] = os.path.getsize(save_path) if phase.startswith('write') else None # 압축 방식별 크기 비교
+            results.append(result)
+        results.append(measure_cold_start('cold_import', '', repeat))
+        results.append(measure_cold_start('cold_show_worksheet_list',
+                                          f'pyexceltool.show_worksheet_list(pyexceltool.load_workbook_with_path({load_path!r}, lazy=True))',
+                                          repeat))
+
+    return {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'openpyxl': openpyxl.__version__,
+            'numpy': np.__version__,
+        },
+        'shape': {'rows': rows, 'columns': columns, 'sheets': sheets, 'seed': seed, 'repeat': repeat},
+        'results': results,
+    }
+
+def compare_benchmark(old_report, new_report):
+    """ 두 benchmark 결과의 단계별 소요시간과 메모리 비율 반환 (1보다 작으면 new가 개선된 것)
+
+    Args:
+        old_report (dict): 이전 run_benchmark 결과
+        new_report (dict): 새 run_benchmark 결과
+
+    Returns:
+        list (dict(phase, seconds_ratio, memory_ratio))
+
+    """
+    old_results = {result['phase']: result for result in old_report['results']}
+    comparison = []
+    for result in new_report['results']:
+        old = old_results.get(result['phase'])
+        if old is None:
+            continue
+        memory_ratio = None
+        if old['peak_traced_bytes'] and result['peak_traced_bytes'] is not None:
+            memory_ratio = result['peak_traced_bytes'] / old['peak_traced_bytes']
+        comparison.append({
+            'phase': result['phase'],
+            'seconds_ratio': result['seconds'] / old['seconds'] if old['seconds'] else None,
+            'memory_ratio': memory_ratio,
+        })
+    return comparison
+
+def _format_ratio(ratio):
+    return '-' if ratio is None else f'{ratio:.2f}x'
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pyexceltool / pandastool benchmark')
+    parser.add_argument('--rows', type=int, default=10000, help='Sheet당 행 수')
+    parser.add_argument('--columns', type=int, default=10, help='열 수')
+    parser.add_argument('--sheets', type=int, default=1, help='Sheet 수')
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 횟수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 seed')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 메모리 측정 생략')
+    parser.add_argument('--output', default='bench_result.json', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--compare', default=None, help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--max-cold-start-seconds', type=float, default=None, help='Sheet 목록 조회 cold start 허용 시간')
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.rows, args.columns, args.sheets, args.repeat, args.seed, not args.no_memory)
+    with open(args.output, 'w', encoding='utf8') as f:
+        json.dump(report, f, indent=2)
+
+    for result in report['results']:
+        print(f"{result['phase']:<26} {result['seconds']:>10.4f}s {result['rows_per_sec'] or 0:>14,.0f} rows/s "
+              f"peak_traced={result['peak_traced_bytes']} process_peak_rss_kb={result['process_peak_rss_kb']}"
+              + (f" file_bytes={result['file_bytes']}" if result.get('file_bytes') else ''))
+    if args.compare:
+        with open(args.compare, encoding='utf8') as f:
+            old_report = json.load(f)
+        for row in compare_benchmark(old_report, report):
+            print(f"{row['phase']:<26} time {_format_ratio(row['seconds_ratio'])} memory {_format_ratio(row['memory_ratio'])}")
+
+    if args.max_cold_start_seconds is not None:
+        cold_start = next(result for result in report['results'] if result['phase'] == 'cold_show_worksheet_list')
+        if cold_start['seconds'] > args.max_cold_start_seconds:
+            print(f"[Error] cold start {cold_start['seconds']:.4f}s exceeds {args.max_cold_start_seconds}s")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+#-*- coding: utf-8 -*-
+"""무거운 라이브러리(pandas, openpyxl 등)를 처음 사용할 때 불러오기 위한 라이브러리
+   ※ 본 문서는 Google Style Python docstring 으로 작성됨
+
+   import 시점에는 모듈이 설치되어 있는지만 확인하고,
+   모듈의 속성(pd.DataFrame 등)에 처음 접근할 때 실제로 import 한다.
+   Sheet 목록만 조회하는 등 짧게 실행되는 스크립트의 시작 시간을 줄인다.
+
+Example:
+    from lazyimport import lazy_import
+    pd = lazy_import('pandas')
+    pd.DataFrame()  # 이 시점에 pandas를 import
+
+
+
+"""
+
+import sys, types, threading, importlib
+import importlib.util
+
+_import_lock = threading.RLock() # 여러 thread에서 처음 접근해도 한 번만, 끝까지 import 되도록 보호
+_lazy_modules = dict()
+
+class _LazyModule(types.ModuleType):
+    """ 속성에 처음 접근할 때 실제 모듈을 import 하여 속성을 채우는 모듈 대리 객체
+
+    실제 import가 끝나기 전까지는 lock을 잡고 있으므로 다른 thread가 초기화 중인 모듈을 보지 않는다.
+    """
+    def _load(self):
+        module = self.__dict__.get('_lazy_module')
+        if module is None:
+            with _import_lock:
+                module = self.__dict__.get('_lazy_module')
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__.update(module.__dict__) # 이후 접근은 __getattr__ 없이 바로 찾도록 속성 복사
+                    self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        # __dict__에 없는 속성(import 전이거나 나중에 추가된 하위 모듈)에 접근할 때만 호출된다
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+def lazy_import(name):
+    """ 모듈을 처음 사용할 때 import 되도록 등록하여 반환
+
+    이미 import 된 모듈이면 그대로 반환한다.
+    여러 thread에서 동시에 처음 사용해도 import가 끝난 모듈만 사용된다.
+
+    Args:
+        name (str): 모듈명 (pandas, openpyxl ...)
+
+    Returns:
+        module
+
+    Raises:
+        ImportError: 모듈이 설치되어 있지 않은 경우
+
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    with _import_lock:
+        if name not in _lazy_modules:
+            if importlib.util.find_spec(name) is None:
+                raise ImportError(f"[Error] {name} is not installed. run: pip install {name}")
+            _lazy_modules[name] = _LazyModule(name)
+        return _lazy_modules[name]
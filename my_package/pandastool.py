@@ -22,26 +22,46 @@ Example:
     datas = select_range_data_from_df(select_data_from_df(df, column_list=[0,8]), start_row=3).values
     
     출력하려면 datas를 이중 for문으로 출력해야 함
+    또는 show_dataframe(df) 로 output.txt에 처음/끝 일부 행만 출력
+
+    복사 없이 numpy view로 1~5번 행과 0~3번 열 가져오기 (is_view로 view/복사 여부 확인)
+    values, is_view = select_array_view(df, slice(1,6), slice(0,4))
+
+    여러 영역을 한 번에 가져오기
+    results = select_many_from_df(df, [(slice(0,10), [0,8]), (None, slice(4,None))])
+
+    Host 열로 index를 만들어 행 찾기
+    index = build_df_index(df, ['Host'], sorted_index=True)
+    df.iloc[index.lookup('host01')]
+    df.iloc[index.range_lookup('host01', 'host09')]
 
 
 
 """
 
-import sys, subprocess
-try:
-    import pandas as pd
-except ImportError:
-    subprocess.check_call([sys.executable, "-m", "pip", "install", 'pandas'])
-finally:
-    import pandas as pd
+import reporttool
+from lazyimport import lazy_import
+pd = lazy_import('pandas') # pandas는 처음 사용할 때 import
+np = lazy_import('numpy')
 
 ### Option Setting
-pd.set_option('display.max_row', None)
-pd.set_option('display.max_columns', None)  # 터미널 화면에 축약없이 전체내용 출력
-pd.set_option('display.max_colwidth', None)
-pd.set_option('display.width', None)
-pd.set_option('display.date_yearfirst',True)
-sys.stdout = open('output.txt', "w", encoding='utf8') # 한글 안깨지게 불러오기
+_pandas_option_applied = False
+
+def set_pandas_option():
+    """ 터미널 화면에 DataFrame을 축약없이 출력하도록 pandas option 설정 (처음 한 번만 적용)
+
+    pandas를 import 해야 하므로 모듈 import 시점이 아닌 출력 함수에서 호출한다.
+    """
+    global _pandas_option_applied
+    if _pandas_option_applied:
+        return
+    pd.set_option('display.max_row', None)
+    pd.set_option('display.max_columns', None)  # 터미널 화면에 축약없이 전체내용 출력
+    pd.set_option('display.max_colwidth', None)
+    pd.set_option('display.width', None)
+    pd.set_option('display.date_yearfirst',True)
+    _pandas_option_applied = True
+
 
 # 원하는 row, col 선택하여 출력 
 # 예시 : select_data_from_df(df, [1,2], [0,1]) # 1,2번 행과 0,1번 열 데이터
@@ -89,9 +109,157 @@ def select_range_data_from_df(df, start_row=0, end_row=None, start_col=0, end_co
         return df.iloc[start_row:,start_col:end_col+1]
     return df.iloc[start_row:end_row+1,start_col:end_col+1]
 
+def _is_view_of_df(values, df):
+    """ numpy 배열이 DataFrame의 데이터를 복사 없이 공유하는지(view인지) 확인
+
+    Args:
+        values (numpy.ndarray) : 확인할 배열
+        df (pandas.DataFrame) : 원본 DataFrame
+
+    Returns:
+        bool
+
+    """
+    if values.size == 0:
+        return False
+    return any(np.may_share_memory(values, df.iloc[:, i].to_numpy(copy=False)) for i in range(df.shape[1]))
+
+def _select_array(values, row=None, column=None):
+    """ 2차원 배열에서 행/열 선택 (slice만 쓰면 view, list가 있으면 복사)
+
+    Args:
+        values (numpy.ndarray) : 2차원 배열
+        row (slice or list or int, optional) : 행 선택. None이면 전체
+        column (slice or list or int, optional) : 열 선택. None이면 전체
+
+    Returns:
+        numpy.ndarray
+
+    """
+    row = slice(None) if row is None else row
+    column = slice(None) if column is None else column
+    if not isinstance(row, slice) and not isinstance(column, slice):
+        return values[np.ix_(np.atleast_1d(row), np.atleast_1d(column))]
+    return values[row, column]
+
+def select_array_view(df, row=None, column=None):
+    """row, column 지정하여 numpy 배열로 가져오기 (가능하면 복사 없이 view로 반환)
+
+    모든 열이 같은 numpy dtype이고(숫자만 있는 DataFrame 등) row, column이 slice이면
+    DataFrame의 데이터를 복사하지 않는 view를 반환한다. 그 외에는 복사본을 반환한다.
+    view는 원본과 메모리를 공유하므로 읽기 전용으로 사용하라.
+
+    Args:
+        df (pandas.DataFrame) : 하나의 DataFrame 객체
+        row (slice or list or int, optional) : 가져올 행 (slice(1,6) 은 1~5번 행). None이면 전체
+        column (slice or list or int, optional) : 가져올 열. None이면 전체
+
+    Returns:
+        tuple (numpy.ndarray, bool) : 선택된 값, view 여부
+
+    """
+    values = _select_array(df.to_numpy(copy=False), row, column)
+    return values, _is_view_of_df(values, df)
+
+def select_many_from_df(df, selections):
+    """여러 (row, column) 선택을 한 번에 처리하여 numpy 배열 목록으로 가져오기
+
+    DataFrame을 numpy 배열로 한 번만 변환한 뒤 모든 선택에 재사용하므로
+    select_data_from_df를 여러 번 호출하는 것보다 빠르다.
+
+    Args:
+        df (pandas.DataFrame) : 하나의 DataFrame 객체
+        selections (list) : (row, column) 목록. row, column은 slice, list, int 또는 None(전체)
+
+    Returns:
+        list (tuple(numpy.ndarray, bool)) : selections 순서대로 선택된 값과 view 여부
+
+    """
+    values = df.to_numpy(copy=False)
+    shares_df = _is_view_of_df(values, df)
+    results = []
+    for row, column in selections:
+        selected = _select_array(values, row, column)
+        results.append((selected, shares_df and np.may_share_memory(selected, values)))
+    return results
+
+class DataFrameIndex:
+    """ DataFrame의 key 열 값으로 행 번호를 찾는 index (build_df_index로 생성)
+
+    hash index로 같은 key의 행 번호를 O(1)에 찾고,
+    sorted_index로 생성한 경우 정렬된 key로 범위 검색을 O(log n)에 수행한다.
+    찾은 행 번호는 df.iloc[...]로 사용한다.
+
+    Args:
+        key_columns (list) : key 열 이름 목록
+        hash_index (dict) : key : 행 번호 배열
+        sorted_keys (pandas.Index, optional) : 정렬된 key
+        sorted_positions (numpy.ndarray, optional) : sorted_keys 순서의 행 번호
+
+    """
+    def __init__(self, key_columns, hash_index, sorted_keys=None, sorted_positions=None):
+        self.key_columns = key_columns
+        self.hash_index = hash_index
+        self.sorted_keys = sorted_keys
+        self.sorted_positions = sorted_positions
+
+    def lookup(self, key):
+        """key와 같은 값을 가진 행 번호 배열 반환 (key 열이 여러 개면 tuple로 입력)
+        """
+        return self.hash_index.get(key, np.empty(0, dtype=np.intp))
+
+    def range_lookup(self, start=None, end=None):
+        """start 이상 end 이하의 key를 가진 행 번호 배열을 key 순서로 반환 (None이면 처음/끝까지)
+
+        Raises:
+            ValueError: sorted_index 없이 생성한 경우
+
+        """
+        if self.sorted_keys is None:
+            raise ValueError("[Error] range_lookup needs an index built with sorted_index=True")
+        lo, hi = self.sorted_keys.slice_locs(start, end)
+        return self.sorted_positions[lo:hi]
+
+    def save(self, file_path):
+        """index를 file_path에 pickle로 저장
+        """
+        pd.to_pickle(self, file_path)
+
+    @staticmethod
+    def load(file_path):
+        """save로 저장한 index를 읽어옴
+        """
+        return pd.read_pickle(file_path)
+
+def build_df_index(df, key_columns, sorted_index=False):
+    """DataFrame의 key 열로 행 번호 index 생성
+
+    Args:
+        df (pandas.DataFrame) : 하나의 DataFrame 객체
+        key_columns (list) : key로 사용할 열 이름 목록 (열이 여러 개면 key는 tuple)
+        sorted_index (bool, optional) : True이면 범위 검색용 정렬 index도 함께 생성
+
+    Returns:
+        DataFrameIndex
+
+    """
+    key_columns = list(key_columns)
+    keys = key_columns[0] if len(key_columns) == 1 else key_columns
+    hash_index = df.groupby(keys, sort=False).indices
+    sorted_keys, sorted_positions = None, None
+    if sorted_index:
+        if len(key_columns) == 1:
+            key_index = pd.Index(df[key_columns[0]])
+        else:
+            key_index = pd.MultiIndex.from_frame(df[key_columns])
+        sorted_positions = key_index.argsort(kind='stable')
+        sorted_keys = key_index.take(sorted_positions)
+    return DataFrameIndex(key_columns, hash_index, sorted_keys, sorted_positions)
+
 def show_pandas_option():
     """ pandas option값 출력하기
     """
+    set_pandas_option()
     date_dayfirst = pd.get_option('display.date_dayfirst')
     date_yearfirst = pd.get_option('display.date_yearfirst')
     max_seq_items = pd.get_option('display.max_seq_items')
@@ -100,7 +268,7 @@ def show_pandas_option():
     max_colwidth = pd.get_option('display.max_colwidth')
     width = pd.get_option('display.width')
 
-    print(f'''
+    reporttool.get_report_writer().write(f'''
 date_yearfirst : {date_yearfirst} # True이면 2005/01/20 형태로 출력/파싱
 max_seq_items : {max_seq_items}
 max_row : {max_row}
@@ -109,25 +277,38 @@ max_colwidth : {max_colwidth}
 width : {width}
 ''')
 
-def show_dataframe_info(df):
-    """하나의 DataFrame 정보 요약하여 출력
-    
+def show_dataframe_info(df, max_items=None):
+    """하나의 DataFrame 정보 요약하여 출력 (reporttool의 기본 writer, output.txt)
+
+    header/index가 많으면 앞/뒤 일부만 출력한다.
+
     Args:
         df (pandas.DataFrame) : 하나의 DataFrame 객체
+        max_items (int, optional) : 출력할 header/index 최대 개수. 입력하지 않을 시 reporttool.default_max_items
 
     """
-    column_list = df.columns.values.tolist() # 전체 컬럼 리스트   (각 열 이름)
-    index_list = df.index.values.tolist()    # 전체 인덱스 리스트 (각 행 이름)
-    print(f'''
-Header : {column_list}
-index : {index_list}
-
+    report = reporttool.get_report_writer()
+    report.write_dataframe_info(df, max_items)
+    report.write('''
 ※ 주의 
 Header가 Excel의 0번 행에 해당하는 경우
 DataFrame에는 실제로 Excel의 1번 행부터 데이터가 들어가므로
 즉, 0번 행 정보 가져오려고 df.iloc[0] 하면 실제론 Excel 의 1번 행 정보를 가져오게 됨
 ''')
 
+def show_dataframe(df, max_rows=None, sample=False):
+    """DataFrame 내용을 한 행씩 출력 (reporttool의 기본 writer, output.txt)
+
+    행이 많으면 처음/끝 일부만 출력하거나 sample이면 균등 간격으로 골라 출력한다.
+
+    Args:
+        df (pandas.DataFrame) : 하나의 DataFrame 객체
+        max_rows (int, optional) : 최대 행 수. 입력하지 않을 시 reporttool.default_max_rows, 0이면 전체
+        sample (bool, optional) : True이면 균등 간격으로 행 선택
+
+    """
+    reporttool.get_report_writer().write_dataframe(df, max_rows, sample)
+
 '''
 DataFrame의 행/열번호는 좌측 상단이 0부터 1,2,3...이다.
 그러나 0번은 index/column 용으로 사용되므로 0번은 버린다.
@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+#-*- coding: utf-8 -*-
+"""pyexceltool 주요 함수의 단계별 소요시간, 처리량, 메모리를 기록하는 라이브러리
+   ※ 본 문서는 Google Style Python docstring 으로 작성됨
+
+   instrument로 감싼 함수(load_workbook_with_path, convert_worksheet_to_df, save_excel 등)가 끝날 때마다
+   등록된 callback에 측정 결과 dict를 넘긴다.
+   함수 안의 세부 단계(행 읽기, DataFrame 생성 등)는 span으로 시간을 나누어 기록한다.
+
+   아래의 기능을 제공한다.
+   측정 결과를 받을 callback 등록/해제
+   호출별 소요시간, 세부 단계 시간, 행/cell 수, 읽은/쓴 byte 수 기록
+   tracemalloc으로 호출 중 최대 메모리 증가량 기록 (memory=True)
+   cProfile로 호출 중 함수별 실행 시간 기록 (profile=True)
+   측정 결과를 함수별로 합산하는 ProfileRecorder
+
+Note:
+   등록된 callback이 없으면 감싼 함수는 callback 목록 확인 한 번만 추가로 수행하므로 성능에 거의 영향이 없다.
+   측정은 thread별로 따로 이루어지며, workers로 실행한 다른 프로세스 안의 작업은 측정되지 않는다.
+   같은 thread에서 감싼 함수가 다른 감싼 함수를 호출하면 안쪽 함수도 따로 기록되고, 바깥 함수의 spans에도 안쪽 함수 이름으로 시간이 더해진다.
+
+Example:
+   import profiletool.py
+
+   측정 결과를 함수별로 합산
+   recorder = ProfileRecorder()
+   with profiling(recorder):
+       df_dict = pyexceltool.convert_worksheet_to_df(load_file_path, sheet_name=["Sheet1"])
+   recorder.summary()   # {'convert_worksheet_to_df': {'calls': 1, 'seconds': ..., 'rows': ..., 'spans': {...}}, ...}
+
+   호출마다 직접 처리 (메모리 증가량, cProfile 결과 포함)
+   add_hook(lambda event: print(event['name'], event['seconds'], event['peak_memory_bytes']))
+   set_capture(memory=True, profile=True)
+
+
+
+"""
+
+import time, threading, functools
+
+### Global Value
+_hooks = []                    # 측정 결과 dict를 받을 callback 목록
+_local = threading.local()     # thread별 실행 중인 측정 stack
+capture_memory = False         # True이면 tracemalloc으로 최대 메모리 증가량 기록
+capture_profile = False        # True이면 cProfile 결과(pstats.Stats)를 기록
+
+def add_hook(callback):
+    """ 측정 결과를 받을 callback 등록
+
+    callback(event)의 event는 dict이다.
+        name (str) : 함수 이름
+        seconds (float) : 소요시간
+        spans (dict) : 세부 단계 이름 : 소요시간
+        counters (dict) : rows, cells, bytes_read, bytes_written 등 처리량
+        peak_memory_bytes (int or None) : 호출 중 최대 메모리 증가량 (capture_memory인 경우)
+        profile (pstats.Stats or None) : cProfile 결과 (capture_profile인 경우)
+        error (Exception or None) : 함수에서 발생한 예외
+
+    Args:
+        callback (callable): event dict 하나를 받는 함수
+
+    """
+    if callback not in _hooks:
+        _hooks.append(callback)
+
+def remove_hook(callback):
+    """ 등록한 callback 해제
+
+    Args:
+        callback (callable): add_hook으로 등록한 함수
+
+    """
+    if callback in _hooks:
+        _hooks.remove(callback)
+
+def clear_hooks():
+    """ 등록한 callback을 모두 해제
+    """
+    del _hooks[:]
+
+def set_capture(memory=False, profile=False):
+    """ 측정 시 메모리(tracemalloc)와 cProfile 기록 여부 설정
+
+    둘 다 실행을 느리게 하므로 원인을 찾을 때만 사용하라.
+
+    Args:
+        memory (bool, optional): 호출 중 최대 메모리 증가량 기록 여부
+        profile (bool, optional): 호출 중 함수별 실행 시간(cProfile) 기록 여부
+
+    """
+    global capture_memory, capture_profile
+    capture_memory, capture_profile = memory, profile
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_null_span = _NullSpan()
+
+class _Span:
+    __slots__ = ('record', 'name', 'start')
+
+    def __init__(self, record, name):
+        self.record = record
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        spans = self.record['spans']
+        spans[self.name] = spans.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+def span(name):
+    """ 실행 중인 측정에 세부 단계 시간을 더하는 context manager (측정 중이 아니면 아무것도 하지 않음)
+
+    Args:
+        name (str): 세부 단계 이름 (read_rows, build_df 등)
+
+    Returns:
+        context manager
+
+    """
+    stack = getattr(_local, 'stack', None)
+    if not stack:
+        return _null_span
+    return _Span(stack[-1], name)
+
+def count(name, value=1):
+    """ 실행 중인 측정의 처리량 counter에 value를 더함 (측정 중이 아니면 아무것도 하지 않음)
+
+    Args:
+        name (str): counter 이름 (rows, cells, bytes_read 등)
+        value (int, optional): 더할 값
+
+    """
+    stack = getattr(_local, 'stack', None)
+    if stack:
+        counters = stack[-1]['counters']
+        counters[name] = counters.get(name, 0) + value
+
+def _run_measured(name, func, measure, args, kwargs):
+    stack = _stack()
+    outermost = not stack
+    record = {'name': name, 'seconds': 0.0, 'spans': dict(), 'counters': dict(), 'peak_memory_bytes': None, 'profile': None, 'error': None}
+    tracing = profiler = None
+    if outermost and capture_memory:
+        import tracemalloc
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        memory_start = tracemalloc.get_traced_memory()[0]
+    if outermost and capture_profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    stack.append(record)
+    start = time.perf_counter()
+    result = None
+    try:
+        result = func(*args, **kwargs)
+        return result
+    except Exception as err:
+        record['error'] = err
+        raise
+    finally:
+        record['seconds'] = time.perf_counter() - start
+        stack.pop()
+        if profiler is not None:
+            import pstats
+            profiler.disable()
+            record['profile'] = pstats.Stats(profiler)
+        if tracing is not None:
+            import tracemalloc
+            record['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1] - memory_start
+            if not tracing:
+                tracemalloc.stop()
+        if measure is not None and record['error'] is None:
+            try:
+                for key, value in measure(result, *args, **kwargs).items():
+                    record['counters'][key] = record['counters'].get(key, 0) + value
+            except Exception: # 측정 실패가 원래 작업을 방해하지 않도록 무시
+                pass
+        if stack:
+            spans = stack[-1]['spans']
+            spans[name] = spans.get(name, 0.0) + record['seconds']
+        for hook in list(_hooks):
+            hook(record)
+
+def instrument(name=None, measure=None):
+    """ 함수 실행을 측정하도록 감싸는 decorator
+
+    등록된 callback이 없으면 원래 함수를 그대로 호출한다.
+    같은 thread에서 같은 이름의 함수가 재귀로 호출되면 바깥 호출만 기록한다.
+
+    Args:
+        name (str, optional): 기록할 이름. 입력하지 않을 시 함수 이름
+        measure (callable, optional): measure(result, *args, **kwargs)로 처리량 dict(rows, bytes_read 등)를 반환하는 함수.
+            측정 중일 때 함수가 정상 종료된 뒤에만 호출된다.
+
+    Returns:
+        decorator
+
+    """
+    def decorator(func):
+        record_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _hooks:
+                return func(*args, **kwargs)
+            stack = _stack()
+            if stack and any(record['name'] == record_name for record in stack):
+                return func(*args, **kwargs)
+            return _run_measured(record_name, func, measure, args, kwargs)
+        return wrapper
+    return decorator
+
+class profiling:
+    """ with 구간 동안 callback을 등록하고 capture 설정을 바꾸는 context manager
+
+    Args:
+        callback (callable): event dict 하나를 받는 함수 (ProfileRecorder 등)
+        memory (bool, optional): 최대 메모리 증가량 기록 여부
+        profile (bool, optional): cProfile 결과 기록 여부
+
+    """
+    def __init__(self, callback, memory=False, profile=False):
+        self.callback = callback
+        self.memory = memory
+        self.profile = profile
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = (capture_memory, capture_profile)
+        set_capture(self.memory, self.profile)
+        add_hook(self.callback)
+        return self.callback
+
+    def __exit__(self, *exc_info):
+        remove_hook(self.callback)
+        set_capture(*self._previous)
+        return False
+
+class ProfileRecorder:
+    """ 측정 결과 event를 모아 함수별로 합산하는 callback
+
+    Args:
+        keep_events (bool, optional): event를 목록(events)에 보관할지 여부
+
+    """
+    def __init__(self, keep_events=True):
+        self.keep_events = keep_events
+        self.events = []
+        self._lock = threading.Lock()
+        self._totals = dict()
+
+    def __call__(self, event):
+        with self._lock:
+            if self.keep_events:
+                self.events.append(event)
+            total = self._totals.setdefault(event['name'], {'calls': 0, 'errors': 0, 'seconds': 0.0, 'spans': dict(), 'peak_memory_bytes': None})
+            total['calls'] += 1
+            total['errors'] += event['error'] is not None
+            total['seconds'] += event['seconds']
+            for key, value in event['spans'].items():
+                total['spans'][key] = total['spans'].get(key, 0.0) + value
+            for key, value in event['counters'].items():
+                total[key] = total.get(key, 0) + value
+            if event['peak_memory_bytes'] is not None:
+                total['peak_memory_bytes'] = max(total['peak_memory_bytes'] or 0, event['peak_memory_bytes'])
+
+    def summary(self):
+        """ 함수별 합산 결과 반환
+
+        Returns:
+            dict (함수 이름 : dict(calls, errors, seconds, spans, peak_memory_bytes, rows, cells, bytes_read, bytes_written ...))
+
+        """
+        with self._lock:
+            return {name: dict(total, spans=dict(total['spans'])) for name, total in self._totals.items()}
+
+    def clear(self):
+        """ 모은 결과를 모두 삭제
+        """
+        with self._lock:
+            self.events = []
+            self._totals = dict()
@@ -11,6 +11,12 @@
    새 openpyxl.Excel.Workbook 생성
    기존 Excel 파일의 Workbook 읽어오기
    Workbook에서 지정한 WorkSheet를 Dict(sheet_name:pandas.DataFrame) 으로 반환
+   WorkSheet를 일정 행 수의 DataFrame chunk로 나누어 순차 반환
+   WorkSheet XML을 직접 읽어 열(column) 단위 배열(DataFrame, numpy, Arrow)로 반환
+   WorkSheet의 일부 범위 cell 값만 Workbook 없이 읽기
+   폴더의 여러 Excel 파일을 병렬로 읽어 변환
+   여러 Excel 파일의 같은 Sheet를 이어붙이거나(concat) key 열로 합치기(join)
+   변환된 Sheet를 디스크에 캐시하여 재사용
    DataFrame을 Excel 파일에 저장
    
 Note:
@@ -27,38 +33,139 @@ Example:
 
    기존 Excel 파일의 Workbook 읽어오기
    workbook = load_workbook_with_path(load_file_path)
+
+   큰 Excel 파일을 읽기 전용(streaming) 모드로 읽어오기 (사용 후 workbook.close() 필요)
+   workbook = load_workbook_with_path(load_file_path, read_only=True)
+
+   Sheet가 많은 파일에서 일부 Sheet만 읽는 경우 필요한 Sheet만 파싱 (사용 후 workbook.close() 필요)
+   workbook = load_workbook_with_path(load_file_path, lazy=True)
+
+   같은 프로세스에서 여러 번 읽는 파일은 파싱한 Workbook을 재사용
+   workbook = load_workbook_with_path(load_file_path, use_cache=True)
     
    Workbook에서 지정한 WorkSheet를 Dict(sheet_name:pandas.DataFrame) 으로 반환
    df_dict = convert_worksheet_to_df(workbook, sheet_name=["Sheet1","Sheet2"], include_index=False, include_column=False)
+
+   열 dtype을 추정하여 int/float/datetime/category 열로 변환
+   df_dict = convert_worksheet_to_df(workbook, sheet_name=["Sheet1"], include_column=True, dtype='infer')
+
+   0, 8번 열의 5번 행부터만 읽어오기 (Excel 범위 지정도 가능: cell_range='A6:I100')
+   df_dict = convert_worksheet_to_df(workbook, sheet_name=["Sheet1"], column_list=[0, 8], start_row=5)
+
+   Status 열이 'OK', 'N/A'가 아닌 행만 읽어오기 (읽은/남긴 행 수는 df.attrs['scanned_rows'], df.attrs['kept_rows'])
+   df_dict = convert_worksheet_to_df(workbook, sheet_name=["Sheet1"], include_column=True, row_filter=[('Status', 'not in', ['OK', 'N/A'])])
+
+   Sheet가 많은 경우 4개 프로세스로 병렬 변환
+   df_dict = convert_worksheet_to_df(workbook, sheet_name=["Sheet1","Sheet2"], workers=4)
    DataFrame을 건드리는 작업은 pandastool.py를 가져와서 사용하도록 하자.
 
+   행 tuple을 거치지 않고 열 단위 배열로 바로 읽기 (output='numpy' 또는 'arrow' 가능)
+   df = read_sheet_columns(load_file_path, "Sheet1", include_column=True)
+
+   큰 파일에서 요약 영역만 Workbook을 만들지 않고 읽기 (행 tuple 목록)
+   rows = read_cell_range(load_file_path, "Sheet1", "A1:F20")
+
+   반복되는 문자열이 많은 열은 공유 문자열 표 번호를 그대로 category로 사용
+   df = read_sheet_columns(load_file_path, "Sheet1", include_column=True, string_dtype='category')
+
+   큰 Sheet를 10000행 단위 DataFrame으로 나누어 처리
+   for chunk in iter_worksheet_chunks(workbook, "Sheet1", chunk_size=10000, include_column=True):
+       ...
+
+   같은 파일을 반복해서 읽는 경우 변환 결과를 디스크에 캐시
+   df_dict = load_df_with_cache(load_file_path, sheet_name=["HP_Checklist"], include_column=True)
+
+   캐시된 Sheet의 Host 열 index를 만들어 함께 캐시 (pandastool.DataFrameIndex)
+   df, index = load_df_index_with_cache(load_file_path, "HP_Checklist", ["Host"], include_column=True)
+   df.iloc[index.lookup("host01")]
+
+   여러 날짜 파일의 같은 Sheet를 하나로 이어붙이기 (행마다 원본 파일 경로를 source_file 열에 기록)
+   df = concat_workbooks(r'C:\\Users\\checklist', sheet_name="HP_Checklist", include_column=True)
+
+   여러 파일의 같은 Sheet를 Host 열 기준으로 옆으로 합치기
+   df = join_workbooks([old_file_path, new_file_path], ["Host"], sheet_name="HP_Checklist", how='outer')
+
+   폴더의 모든 Excel 파일을 병렬로 읽어 파일별 dict(sheet_name:DataFrame) 으로 반환
+   results, errors = load_workbooks_in_directory(r'C:\\Users\\checklist', sheet_name=["HP_Checklist"], workers=8)
+
    DataFrame을 Excel 파일에 저장
    save_df_to_excel(df_dict, workbook, sheet_name="Sheet", file_path=save_file_path, include_index=False, include_column=False)
 
+   기존 Excel 파일의 Sheet에 새로 추가/변경된 행만 반영 (Host 열로 같은 행 판단)
+   save_df_to_excel(df_dict, None, sheet_name=["Sheet"], file_path=save_file_path, include_column=True, incremental=True, key_columns=["Host"])
 
+   행이 많은 DataFrame을 새 Excel 파일에 빠르게 저장 (write-only)
+   stream_df_to_excel(df_dict, sheet_name=["Sheet"], file_path=save_file_path, include_column=True)
 
-"""
+   다시 쓰고 곧 읽는 중간 파일은 압축하지 않고 저장 (보관용은 compress_level=9)
+   stream_df_to_excel(df_dict, sheet_name=["Sheet"], file_path=save_file_path, include_column=True, compression='stored')
 
-import sys, subprocess, os, datetime
-from itertools import islice
-try:
-    import pandas as pd
-except ImportError:
-    subprocess.check_call([sys.executable, "-m", "pip", "install", 'pandas'])
-finally:
-    import pandas as pd
+   Sheet가 많은 보고서를 4개 프로세스로 Sheet마다 병렬 기록하여 새 파일로 저장
+   save_df_to_excel(df_dict, None, sheet_name=list(df_dict), file_path=save_file_path, include_column=True, workers=4)
+
+   어느 단계(행 읽기, DataFrame 생성, 저장 등)에 시간이 걸리는지 함수별로 합산 (profiletool.py 참고)
+   recorder = profiletool.ProfileRecorder()
+   with profiletool.profiling(recorder, memory=True):
+       df_dict = convert_worksheet_to_df(load_file_path, sheet_name=["Sheet1"])
+   recorder.summary()
+
+   asyncio 코드에서 event loop를 막지 않고 읽기/변환/저장 (30초 안에 끝나지 않으면 asyncio.TimeoutError)
+   df_dict = await convert_worksheet_to_df_async(load_file_path, sheet_name=["Sheet1"], include_column=True, timeout=30)
+   workbook = await load_workbook_with_path_async(load_file_path)
+   await save_excel_async(workbook, save_file_path)
 
-try: import openpyxl
-except ImportError: subprocess.check_call([sys.executable, "-m", "pip", "install", 'openpyxl'])
-finally: import openpyxl
 
-from openpyxl.utils.dataframe import dataframe_to_rows
+
+"""
+
+import os, datetime, glob, hashlib, json, shutil, threading, zipfile, posixpath, operator, re, tempfile, functools, weakref, math, mmap
+from array import array
+import xml.etree.ElementTree as ET
+from itertools import islice
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, CancelledError, wait, FIRST_COMPLETED
+from lazyimport import lazy_import
+import profiletool
+# pandas, numpy, openpyxl은 처음 사용할 때 import 하여 Sheet 목록 조회 등 짧은 작업의 시작 시간을 줄인다
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+openpyxl = lazy_import('openpyxl')
+asyncio = lazy_import('asyncio')
 
 ### Global Value
 current_time = datetime.datetime.today()
 today_date = current_time.date()
 default_save_directory = r'C:\\Users\\'
 default_save_path = f"{default_save_directory}pyexceltool_result_{today_date}.xlsx"
+default_chunk_size = 10000 # DataFrame 변환 시 한 번에 읽어오는 행 수
+default_cache_directory = os.path.join(os.path.expanduser('~'), '.pyexceltool_cache')
+default_cache_max_bytes = 1024 * 1024 * 1024 # 변환된 Sheet 캐시의 최대 크기 (1GB)
+category_max_ratio = 0.5 # dtype='infer'에서 고유값 비율이 이 값 이하인 문자열 열은 category로 변환
+_file_digest_memo = dict() # (file_path, size, mtime) : 파일 내용 hash
+workbook_cache_size = 8 # 프로세스 내에 유지할 Workbook 최대 개수
+workbook_cache_max_bytes = 256 * 1024 * 1024 # 캐시된 Workbook 파일 크기 합의 최대값
+_workbook_cache = OrderedDict() # (file_path, read_only) : (size, mtime, workbook)
+_workbook_cache_lock = threading.Lock()
+async_max_workers = 4     # async 함수가 사용하는 thread pool의 thread 수
+async_max_concurrency = 4 # event loop 하나에서 동시에 실행할 async 작업(load/convert/save) 최대 개수
+_async_executor = None
+_async_executor_lock = threading.Lock()
+_async_semaphores = weakref.WeakKeyDictionary() # event loop : asyncio.Semaphore
+DTYPE_ALIAS = {'int': 'int64', 'float': 'float64', 'datetime': 'datetime64[ns]', 'date': 'datetime64[ns]'}
+DTYPE_FALLBACK = {'int64': 'Int64', 'bool': 'boolean'} # 결측값(None)이 있어 변환 실패 시 nullable dtype 사용
+FILTER_OPERATORS = {
+    '==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+    'in': lambda value, values: value in values, 'not in': lambda value, values: value not in values,
+}
+ROW_XML_RE = re.compile(rb'<row\b[^>]*?(?:/>|>.*?</row>)', re.DOTALL)
+ROW_NUMBER_RE = re.compile(rb'\sr="(\d+)"')
+default_compression = 'deflate' # 저장 시 zip 압축 방식 ('deflate' 또는 'stored')
+default_compress_level = None   # deflate 압축 수준 (1: 빠름 ~ 9: 작은 파일, None: zlib 기본값 6)
+ZIP_COMPRESSION = {'deflate': zipfile.ZIP_DEFLATED, 'stored': zipfile.ZIP_STORED}
+PARALLEL_DATE_STYLE = 1 # parallel_df_to_excel이 만드는 styles.xml의 날짜 형식 style 번호
+SHEET_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+DOC_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
 
 def show_worksheet_list(workbook):
     """ Workbook의 sheet 목록 조회
@@ -85,14 +192,123 @@ def create_new_workbook(sheet_name=['Sheet']):
         workbook.create_sheet(title=sheet,index=None)
     return workbook
 
-def load_workbook_with_path(file_path):
+def _read_relationships(archive, rels_path):
+    """ .rels 파일을 읽어 관계 Id별 대상 part 경로를 반환
+
+    Args:
+        archive (zipfile.ZipFile): xlsx 압축파일
+        rels_path (str): 읽어올 .rels 파일 경로 (xl/_rels/workbook.xml.rels)
+
+    Returns:
+        dict (Id : archive 내부 경로)
+
+    """
+    base = posixpath.dirname(posixpath.dirname(rels_path))
+    targets = dict()
+    for rel in ET.fromstring(archive.read(rels_path)).iter(f'{PKG_REL_NS}Relationship'):
+        target = rel.get('Target')
+        if target.startswith('/'):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(base, target))
+        targets[rel.get('Id')] = target
+    return targets
+
+def _find_workbook_part(archive):
+    workbook_part = 'xl/workbook.xml'
+    for target in _read_relationships(archive, '_rels/.rels').values():
+        if target.endswith('workbook.xml'):
+            workbook_part = target
+    return workbook_part
+
+def _read_workbook_manifest(archive):
+    """ xlsx 압축파일의 workbook.xml만 읽어 Sheet명과 Sheet XML part 경로를 순서대로 반환
+
+    Sheet 내용은 읽지 않으므로 Sheet 수/크기와 관계없이 빠르다.
+
+    Args:
+        archive (zipfile.ZipFile): xlsx 압축파일
+
+    Returns:
+        dict (sheet_name : archive 내부의 Sheet XML 경로)
+
+    """
+    workbook_part = _find_workbook_part(archive)
+    workbook_dir, workbook_file = posixpath.split(workbook_part)
+    targets = _read_relationships(archive, posixpath.join(workbook_dir, '_rels', f'{workbook_file}.rels'))
+    manifest = dict()
+    for sheet in ET.fromstring(archive.read(workbook_part)).iter(f'{SHEET_MAIN_NS}sheet'):
+        manifest[sheet.get('name')] = targets.get(sheet.get(f'{DOC_REL_NS}id'))
+    return manifest
+
+class LazyWorkbook:
+    """ Sheet 목록만 먼저 읽고 Sheet 내용은 처음 접근할 때 파싱하는 Workbook
+
+    열 때는 workbook.xml(Sheet 목록)만 읽으므로 show_worksheet_list는 Sheet 크기와 관계없이 빠르고,
+    workbook[sheet_name]으로 처음 접근할 때 해당 Sheet만 읽기 전용 Worksheet로 연다.
+    openpyxl.Workbook과 같이 sheetnames, in, [] 를 지원하므로
+    show_worksheet_list, convert_worksheet_to_df, iter_worksheet_chunks에 그대로 넘길 수 있다.
+    사용 후 close()로 닫거나 with 문으로 사용한다.
+
+    Args:
+        file_path (str): 불러올 Excel 파일의 절대 경로
+
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+        with zipfile.ZipFile(file_path) as archive:
+            self._manifest = _read_workbook_manifest(archive)
+        self._workbook = None
+
+    @property
+    def sheetnames(self):
+        return list(self._manifest)
+
+    def __contains__(self, sheet_name):
+        return sheet_name in self._manifest
+
+    def __iter__(self):
+        return (self[sheet_name] for sheet_name in self._manifest)
+
+    def __getitem__(self, sheet_name):
+        if sheet_name not in self._manifest:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        if self._workbook is None: # 읽기 전용 Workbook은 Sheet XML을 순회할 때 파싱한다
+            self._workbook = openpyxl.load_workbook(self.file_path, read_only=True)
+        return self._workbook[sheet_name]
+
+    def close(self):
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _measure_file_read(result, file_path, *args, **kwargs):
+    return {'bytes_read': os.path.getsize(file_path)}
+
+@profiletool.instrument(measure=_measure_file_read)
+def load_workbook_with_path(file_path, read_only=False, use_cache=False, lazy=False):
     """ 기존 Excel 파일의 Workbook을 가져옴
 
     Args:
         file_path (str): 불러올 파일의 경로
+        read_only (bool, optional): True이면 읽기 전용(streaming) 모드로 연다.
+            시트 XML을 필요할 때 순차적으로 파싱하므로 Cell 객체를 메모리에 올리지 않는다.
+            읽기 전용 Workbook은 수정/저장이 불가하며 사용 후 workbook.close()로 닫아야 한다.
+        use_cache (bool, optional): True이면 같은 프로세스에서 이미 읽은 Workbook을 재사용한다.
+            파일의 크기/수정시각이 바뀌지 않았다면 다시 파싱하지 않고 같은 객체를 반환하므로
+            반환된 Workbook을 수정하면 이후 같은 파일을 불러오는 모든 곳에 반영된다.
+            캐시된 읽기 전용 Workbook은 캐시에서 밀려날 때 닫히므로 직접 close()하지 않는다.
+        lazy (bool, optional): True이면 Sheet 목록만 읽고 Sheet는 처음 접근할 때 파싱하는 LazyWorkbook을 반환한다.
+            Sheet가 많은 파일에서 일부 Sheet만 읽는 경우 사용한다. (read_only, use_cache는 무시됨)
 
     Returns:
-        openpyxl.Workbook
+        openpyxl.Workbook or LazyWorkbook
 
     Raises:
         ValueError: File path를 입력하지 않은 경우
@@ -108,90 +324,2314 @@ def load_workbook_with_path(file_path):
     if not os.path.exists(file_path):
         raise ValueError("[Error] Can't find the file from the given file path")
 
+    if lazy:
+        try:
+            return LazyWorkbook(file_path)
+        except PermissionError:
+            raise ValueError(f'[Error] Excel file is open or the same file name exists: {file_path}')
+        except Exception as err:
+            raise ValueError(f"[Error] Can't open the file: {file_path}") from err
+    if use_cache:
+        workbook = _get_cached_workbook(file_path, read_only)
+        if workbook is not None:
+            return workbook
+
     # <class 'openpyxl.worksheet.worksheet.Worksheet'>
     try:
-        workbook = openpyxl.load_workbook(file_path)
+        workbook = openpyxl.load_workbook(file_path, read_only=read_only)
     except FileNotFoundError:
-        raise ValueError(r'[Error] Excel file not found. check the filepath: {file_path}')
+        raise ValueError(f'[Error] Excel file not found. check the filepath: {file_path}')
     except PermissionError:
-        raise ValueError(r'[Error] Excel file is open or the same file name exists: {file_path}')
+        raise ValueError(f'[Error] Excel file is open or the same file name exists: {file_path}')
     except Exception as err:
-        raise ValueError(r"[Error] Can't open the file: {file_path}") from err
+        raise ValueError(f"[Error] Can't open the file: {file_path}") from err
+    workbook.file_path = file_path # 병렬 변환 시 각 프로세스가 같은 파일을 다시 열 수 있도록 경로 기록
+    if use_cache:
+        _put_cached_workbook(file_path, read_only, workbook)
     return workbook
 
-def convert_worksheet_to_df(workbook, sheet_name=['Sheet'], include_index=False, include_column=False):
+def _get_cached_workbook(file_path, read_only):
+    """ 캐시에서 Workbook을 찾아 반환 (파일이 바뀐 경우 캐시에서 제거하고 None 반환)
+
+    Args:
+        file_path (str): Excel 파일의 절대 경로
+        read_only (bool): 읽기 전용 모드 여부
+
+    Returns:
+        openpyxl.Workbook or None
+
+    """
+    stat = os.stat(file_path)
+    key = (file_path, read_only)
+    with _workbook_cache_lock:
+        entry = _workbook_cache.get(key)
+        if entry is None:
+            return None
+        size, mtime, workbook = entry
+        if (size, mtime) != (stat.st_size, stat.st_mtime_ns):
+            del _workbook_cache[key]
+            if read_only:
+                workbook.close()
+            return None
+        _workbook_cache.move_to_end(key)
+        return workbook
+
+def _put_cached_workbook(file_path, read_only, workbook):
+    """ Workbook을 캐시에 넣고 개수/크기 제한을 넘으면 가장 오래 사용하지 않은 Workbook부터 제거
+
+    Args:
+        file_path (str): Excel 파일의 절대 경로
+        read_only (bool): 읽기 전용 모드 여부
+        workbook (openpyxl.Workbook): 캐시할 Workbook 객체
+
+    """
+    stat = os.stat(file_path)
+    with _workbook_cache_lock:
+        _workbook_cache[(file_path, read_only)] = (stat.st_size, stat.st_mtime_ns, workbook)
+        _workbook_cache.move_to_end((file_path, read_only))
+        while len(_workbook_cache) > 1 and (len(_workbook_cache) > workbook_cache_size
+               or sum(size for size, _, _ in _workbook_cache.values()) > workbook_cache_max_bytes):
+            (_, evicted_read_only), (_, _, evicted) = _workbook_cache.popitem(last=False)
+            if evicted_read_only:
+                evicted.close()
+
+def clear_workbook_cache():
+    """ load_workbook_with_path(use_cache=True)로 캐시된 Workbook을 모두 제거
+    """
+    with _workbook_cache_lock:
+        for (_, read_only), (_, _, workbook) in _workbook_cache.items():
+            if read_only:
+                workbook.close()
+        _workbook_cache.clear()
+
+def _infer_column_dtype(series):
+    """ object 열의 값을 보고 알맞은 dtype을 추정
+
+    Args:
+        series (pandas.Series): 추정할 열
+
+    Returns:
+        str or None : int64, Int64, float64, bool, boolean, datetime64[ns], category 중 하나. 추정 불가 시 None
+
+    """
+    kind = pd.api.types.infer_dtype(series, skipna=True)
+    has_na = series.isna().any()
+    if kind == 'integer':
+        return 'Int64' if has_na else 'int64'
+    if kind in ('floating', 'mixed-integer-float', 'decimal'):
+        return 'float64'
+    if kind == 'boolean':
+        return 'boolean' if has_na else 'bool'
+    if kind in ('datetime', 'datetime64', 'date'):
+        return 'datetime64[ns]'
+    if kind == 'string' and series.nunique() <= len(series) * category_max_ratio:
+        return 'category'
+    return None
+
+def _resolve_column_dtypes(df, dtype):
+    """ dtype 옵션을 DataFrame 열 위치별 dtype으로 변환
+
+    Args:
+        df (pandas.DataFrame): 시트의 첫 chunk
+        dtype (str or dict): 'infer' 또는 dict(column명 또는 열 번호 : dtype)
+
+    Returns:
+        dict (열 번호 : dtype)
+
+    """
+    if dtype == 'infer':
+        dtypes = {i: _infer_column_dtype(df.iloc[:, i]) for i in range(df.shape[1])}
+        return {i: column_dtype for i, column_dtype in dtypes.items() if column_dtype is not None}
+    dtypes = dict()
+    for key, column_dtype in dtype.items():
+        if key in df.columns:
+            position = df.columns.get_loc(key)
+        elif isinstance(key, int) and 0 <= key < df.shape[1]:
+            position = key
+        else:
+            continue
+        dtypes[position] = DTYPE_ALIAS.get(column_dtype, column_dtype)
+    return dtypes
+
+def _cast_keeps_values(series, converted):
+    """ dtype 변환 결과가 원래 값을 그대로 유지하는지 확인
+
+    결측값이 다른 값(bool의 False 등)으로 바뀌었거나, 정수/bool로 변환하며 값이 달라진 경우(2.7 -> 2) False를 반환한다.
+    """
+    missing = series.isna()
+    if not missing.equals(converted.isna()):
+        return False
+    if not (pd.api.types.is_integer_dtype(converted.dtype) or pd.api.types.is_bool_dtype(converted.dtype)):
+        return True
+    original, values = series[~missing], converted[~missing]
+    if pd.api.types.is_integer_dtype(converted.dtype):
+        original = pd.to_numeric(original, errors='coerce') # 숫자가 아닌 값은 NaN이 되어 일치하지 않음
+    return bool((original == values.astype(object)).all())
+
+def _apply_column_dtypes(df, dtypes):
+    """ 열 위치별 dtype으로 DataFrame 열을 변환 (변환할 수 없거나 변환 시 값이 바뀌는 열은 그대로 둠)
+
+    dtype은 첫 chunk로 정하므로 이후 chunk에서는 결측값이나 실수 값이 있을 수 있다.
+    변환 결과가 원래 값과 다르면 nullable dtype(Int64, boolean)으로 다시 시도하고, 그래도 다르면 object로 둔다.
+
+    Args:
+        df (pandas.DataFrame): 변환할 DataFrame
+        dtypes (dict): 열 번호 : dtype
+
+    Returns:
+        pandas.DataFrame
+
+    """
+    for position, column_dtype in dtypes.items():
+        series = df.iloc[:, position]
+        candidates = (column_dtype, DTYPE_FALLBACK.get(column_dtype))
+        if column_dtype in DTYPE_FALLBACK and series.isna().any(): # 결측값이 있으면 바로 nullable dtype
+            candidates = candidates[1:]
+        for candidate in candidates:
+            if candidate is None:
+                break
+            try:
+                converted = series.astype(candidate)
+            except (ValueError, TypeError):
+                continue
+            if _cast_keeps_values(series, converted):
+                df.isetitem(position, converted)
+                break
+    return df
+
+def _compile_row_filter(row_filter, header=None):
+    """ row_filter 조건들을 행 tuple 하나를 받아 bool을 반환하는 함수로 변환
+
+    Args:
+        row_filter (callable or tuple or list): 조건 하나 또는 조건 목록 (모두 만족해야 함)
+            callable(row) 또는 (column, 연산자, 값). 연산자는 ==, !=, <, <=, >, >=, in, not in
+            column은 header명(include_column인 경우) 또는 읽어온 행에서의 열 번호(0부터)
+        header (tuple, optional): header 행
+
+    Returns:
+        callable
+
+    Raises:
+        ValueError: 지원하지 않는 연산자이거나 header에 없는 column인 경우
+
+    """
+    if callable(row_filter) or isinstance(row_filter, tuple):
+        row_filter = [row_filter]
+    predicates = []
+    for condition in row_filter:
+        if callable(condition):
+            predicates.append(condition)
+            continue
+        column, op, value = condition
+        if op not in FILTER_OPERATORS:
+            raise ValueError(f"[Error] Not supported filter operator: {op}")
+        if not isinstance(column, int):
+            if header is None or column not in header:
+                raise ValueError(f"[Error] {column} is not in the header")
+            column = header.index(column)
+        if op in ('in', 'not in'):
+            try:
+                value = frozenset(value)
+            except TypeError: # hash 불가한 값이 섞인 경우 그대로 비교
+                pass
+        predicates.append(_make_condition(column, FILTER_OPERATORS[op], value))
+
+    def predicate(row):
+        return all(condition(row) for condition in predicates)
+    return predicate
+
+def _make_condition(position, compare, value):
+    """ 행의 position번 값을 value와 비교하는 함수 반환 (값이 없거나 비교 불가하면 False)
+    """
+    def condition(row):
+        try:
+            return compare(row[position], value)
+        except (TypeError, IndexError):
+            return False
+    return condition
+
+def _filter_rows(rows, predicate, scan_stats):
+    """ 조건을 만족하는 행만 반환하며 읽은 행 수와 남긴 행 수를 scan_stats에 기록
+    """
+    for row in rows:
+        scan_stats['scanned_rows'] += 1
+        if predicate(row):
+            scan_stats['kept_rows'] += 1
+            yield row
+
+def _iter_df_chunks(rows, include_index=False, include_column=False, chunk_size=default_chunk_size, dtype=None, row_filter=None, scan_stats=None):
+    """ row tuple iterator를 chunk_size 행 단위의 DataFrame으로 나누어 반환
+
+    Args:
+        rows (iterator): 시트의 값 tuple을 한 행씩 반환하는 iterator
+        include_index (bool, optional): 0번 열을 index로 사용할지 여부
+        include_column (bool, optional): 0번 행을 column(header)로 사용할지 여부
+        chunk_size (int, optional): chunk 하나의 최대 행 수
+        dtype (str or dict, optional): 'infer' 또는 dict(column명 또는 열 번호 : dtype).
+            첫 chunk에서 정한 열별 dtype을 이후 모든 chunk에 같이 적용한다.
+        row_filter (callable or tuple or list, optional): DataFrame에 넣기 전에 행을 거르는 조건
+        scan_stats (dict, optional): 읽은 행 수(scanned_rows)와 남긴 행 수(kept_rows)를 누적할 dict
+
+    Yields:
+        pandas.DataFrame
+
+    """
+    if scan_stats is None:
+        scan_stats = dict()
+    scan_stats.setdefault('scanned_rows', 0)
+    scan_stats.setdefault('kept_rows', 0)
+    dtypes = None
+    col = None
+    header = None
+    if include_column:
+        header = next(rows, None)
+        if header is None:
+            return
+        col = header[1:] if include_index else header
+    if row_filter is not None:
+        rows = _filter_rows(rows, _compile_row_filter(row_filter, header), scan_stats)
+    offset = 0
+    while True:
+        with profiletool.span('read_rows'): # zip 압축 해제, XML 파싱, 행 tuple 생성
+            datas = list(islice(rows, chunk_size))
+        if not datas:
+            break
+        if row_filter is None:
+            scan_stats['scanned_rows'] += len(datas)
+            scan_stats['kept_rows'] += len(datas)
+        if include_index:
+            idx = [r[0] for r in datas]
+            datas = [r[1:] for r in datas]
+        else: # chunk를 이어붙여도 행 번호가 이어지도록 index를 지정
+            idx = range(offset, offset + len(datas))
+        offset += len(datas)
+        with profiletool.span('build_df'):
+            df = pd.DataFrame(datas, index=idx, columns=col)
+        del datas
+        if dtype is not None:
+            with profiletool.span('apply_dtype'):
+                if dtypes is None:
+                    dtypes = _resolve_column_dtypes(df, dtype)
+                df = _apply_column_dtypes(df, dtypes)
+        df.attrs.update(scan_stats)
+        yield df
+
+def _column_position(column):
+    """ 열 번호(0부터 시작) 또는 Excel 열 문자('A', 'AB')를 0부터 시작하는 열 번호로 변환
+
+    Args:
+        column (int or str): 열 번호 또는 열 문자
+
+    Returns:
+        int
+
+    """
+    if isinstance(column, str):
+        from openpyxl.utils.cell import column_index_from_string
+        return column_index_from_string(column.upper()) - 1
+    return column
+
+def _iter_selected_rows(worksheet, column_list=None, start_row=0, end_row=None, cell_range=None):
+    """ Worksheet에서 지정한 행 범위/열만 값 tuple로 반환
+
+    행/열 범위를 openpyxl.iter_rows에 넘겨 읽는 도중 범위 밖의 cell은 건너뛰고,
+    읽기 전용 Worksheet는 end_row 이후의 XML은 파싱하지 않는다.
+
+    Args:
+        worksheet (openpyxl.Worksheet): 읽어올 Worksheet
+        column_list (list, optional): 가져올 열 번호(0부터) 또는 Excel 열 문자 목록. 순서대로 반환
+        start_row (int, optional): 시작 행 번호 (0부터)
+        end_row (int, optional): 끝 행 번호 (포함)
+        cell_range (str, optional): Excel 범위 ('B5:F100', 'A:C'). 행 범위와 열 범위(column_list가 없는 경우)를 대신함
+
+    Returns:
+        iterator (tuple)
+
+    """
+    min_col, max_col = None, None
+    min_row, max_row = start_row + 1, None if end_row is None else end_row + 1
+    if cell_range is not None:
+        from openpyxl.utils.cell import range_boundaries
+        min_col, range_min_row, max_col, max_row = range_boundaries(cell_range.upper())
+        min_row = range_min_row or 1
+    positions = None
+    if column_list is not None:
+        positions = [_column_position(column) for column in column_list]
+        min_col, max_col = min(positions) + 1, max(positions) + 1
+    rows = worksheet.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True)
+    if positions is None or positions == list(range(min_col - 1, max_col)):
+        return rows
+    offsets = [position - min_col + 1 for position in positions]
+    return (tuple(row[offset] for offset in offsets) for row in rows)
+
+def iter_worksheet_chunks(workbook, sheet_name='Sheet', chunk_size=default_chunk_size, include_index=False, include_column=False, dtype=None,
+                          column_list=None, start_row=0, end_row=None, cell_range=None, row_filter=None):
+    """ Workbook의 Sheet 하나를 chunk_size 행 단위의 DataFrame으로 나누어 순서대로 반환
+
+    한 번에 chunk 하나만 메모리에 올라가므로 메모리에 다 들어가지 않는 큰 시트도
+    일정한 메모리로 집계/필터링할 수 있다. (read_only=True로 연 Workbook 사용 권장)
+    include_column이면 0번 행을 한 번만 header로 읽어 모든 chunk의 column으로 사용하고,
+    include_index가 아니면 chunk의 index는 시트 전체 기준 행 번호로 이어진다.
+
+    Args:
+        workbook (openpyxl.Workbook): Workbook 객체
+        sheet_name (str): 읽어올 Excel Workbook의 Sheet명
+        chunk_size (int, optional): chunk 하나의 최대 행 수
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        dtype (str or dict, optional): 열 dtype 지정. convert_worksheet_to_df의 dtype 참고
+        column_list (list, optional): 가져올 열 번호(0부터) 또는 Excel 열 문자 목록
+        start_row (int, optional): 시작 행 번호 (0부터)
+        end_row (int, optional): 끝 행 번호 (포함)
+        cell_range (str, optional): Excel 범위 ('B5:F100')
+        row_filter (callable or tuple or list, optional): 행 조건. convert_worksheet_to_df의 row_filter 참고
+
+    Yields:
+        pandas.DataFrame : chunk.attrs의 scanned_rows, kept_rows에 지금까지 읽은/남긴 행 수가 들어있다.
+
+    Raises:
+        ValueError: sheet_name이 Workbook에 존재하지 않거나 chunk_size가 1보다 작은 경우
+
+    """
+    if sheet_name not in workbook:
+        raise ValueError(f"[Error] {sheet_name} is not exist")
+    if chunk_size < 1:
+        raise ValueError("[Error] chunk_size should be greater than 0")
+    rows = _iter_selected_rows(workbook[sheet_name], column_list, start_row, end_row, cell_range)
+    yield from _iter_df_chunks(rows, include_index, include_column, chunk_size, dtype, row_filter)
+
+def _convert_sheet_to_columns(file_path, sheet, include_index=False, include_column=False, chunk_size=default_chunk_size, options=None):
+    """ 별도 프로세스에서 Sheet 하나를 읽기 전용으로 열어 열(column) 단위 payload로 반환
+
+    DataFrame 대신 열별 numpy 배열만 돌려주어 프로세스 간 전송(pickle) 크기를 줄인다.
+
+    Args:
+        file_path (str): 읽어올 Excel 파일의 경로
+        sheet (str): 읽어올 Sheet명
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        chunk_size (int, optional): 한 번에 DataFrame으로 변환할 최대 행 수
+        options (dict, optional): convert_worksheet_to_df에 그대로 넘길 나머지 옵션 (dtype, column_list 등)
+
+    Returns:
+        dict (columns : list, index : numpy.ndarray or None, data : list(array))
+
+    """
+    workbook = load_workbook_with_path(file_path, read_only=True)
+    try:
+        df = convert_worksheet_to_df(workbook, [sheet], include_index, include_column, chunk_size, **(options or {}))[sheet]
+    finally:
+        workbook.close()
+    return {
+        'columns': df.columns.tolist(),
+        'index': df.index.to_numpy() if include_index else None,
+        'data': [df.iloc[:, i].array for i in range(df.shape[1])], # category 등 pandas dtype 유지
+        'attrs': df.attrs,
+    }
+
+def _columns_to_df(payload):
+    """ _convert_sheet_to_columns의 payload를 DataFrame으로 복원
+
+    Args:
+        payload (dict): columns, index, data 를 담은 dict
+
+    Returns:
+        pandas.DataFrame
+
+    """
+    if not payload['data']:
+        df = pd.DataFrame()
+    else:
+        df = pd.DataFrame(dict(enumerate(payload['data'])), index=payload['index'])
+        df.columns = payload['columns']
+    df.attrs.update(payload['attrs'])
+    return df
+
+def _measure_dfs(result, *args, **kwargs):
+    return {'rows': sum(len(df) for df in result.values()), 'cells': sum(df.size for df in result.values())}
+
+@profiletool.instrument(measure=_measure_dfs)
+def convert_worksheet_to_df(workbook, sheet_name=['Sheet'], include_index=False, include_column=False, chunk_size=default_chunk_size, workers=None, dtype=None,
+                            column_list=None, start_row=0, end_row=None, cell_range=None, row_filter=None):
     """ Excel 파일에서 원하는 Sheet를 지정해 list(Dataframe) 으로 반환
 
+    시트의 값만(values_only) 한 행씩 읽어 chunk_size 행 단위로 DataFrame을 만든 뒤 합치므로
+    시트 전체의 행 list를 한 번에 만들지 않는다.
+    load_workbook_with_path(file_path, read_only=True)로 연 Workbook을 넘기면 Cell 객체도 생성되지 않는다.
+
+    workers를 지정하면 Sheet마다 별도 프로세스에서 파일을 읽기 전용으로 다시 열어 병렬로 변환한다.
+    Sheet가 많은 파일에서 변환 시간이 Sheet 수가 아닌 CPU core 수에 비례해 줄어든다.
+    (Windows에서는 호출부를 if __name__ == "__main__": 아래에 두어야 한다.)
+
+    dtype을 지정하면 읽는 도중 chunk마다 열을 int/float/bool/datetime64/category로 변환하므로
+    모든 열이 object인 DataFrame보다 메모리가 작고 이후 pandastool 작업이 빠르다.
+    dtype='infer'는 첫 chunk의 값으로 열별 dtype을 추정하며, 고유값 비율이 category_max_ratio 이하인 문자열 열은 category가 된다.
+    변환할 수 없는 값이 섞인 열은 object로 남는다.
+
+    column_list, start_row, end_row, cell_range로 읽을 영역을 지정하면 읽는 도중 영역 밖의 cell을 건너뛰므로
+    변환 후 pandastool.select_*로 잘라내는 것보다 시간과 메모리가 선택한 영역 크기에 비례한다.
+    include_index, include_column은 선택한 영역의 첫 열/첫 행을 기준으로 한다.
+
+    row_filter를 지정하면 행을 읽는 즉시 조건을 검사하여 만족하지 않는 행은 DataFrame에 넣지 않는다.
+    읽은 행 수와 남긴 행 수는 반환된 DataFrame의 attrs['scanned_rows'], attrs['kept_rows']에 기록된다.
+    (workers 사용 시 row_filter에 lambda 등 pickle 불가한 함수는 사용할 수 없다.)
+
     Args:
-        file_path (str): 저장할 대상 Excel Workbook
+        workbook (openpyxl.Workbook or str): load_workbook_with_path로 가져온 Workbook 또는 Excel 파일 경로
         sheet_name (list): Excel Workbook의 Sheet명
         include_index (bool, optional): index 포함여부
         include_column (bool, optional): column(header) 포함여부
+        chunk_size (int, optional): 한 번에 DataFrame으로 변환할 최대 행 수
+        workers (int, optional): 병렬 변환에 사용할 최대 프로세스 수. None이면 현재 프로세스에서 순차 변환
+        dtype (str or dict, optional): 'infer' 또는 dict(column명 또는 열 번호 : dtype).
+            dtype은 'int', 'float', 'bool', 'datetime', 'category' 등 pandas dtype 문자열. None이면 변환하지 않음
+        column_list (list, optional): 가져올 열 번호(0부터) 또는 Excel 열 문자 목록 ([0, 8] 또는 ['A', 'I'])
+        start_row (int, optional): 시작 행 번호 (0부터)
+        end_row (int, optional): 끝 행 번호 (포함)
+        cell_range (str, optional): Excel 범위 ('A5:I100'). 행 범위와 열 범위(column_list가 없는 경우)를 대신함
+        row_filter (callable or tuple or list, optional): 남길 행의 조건. 목록이면 모든 조건을 만족하는 행만 남긴다.
+            callable(row) 또는 (column, 연산자, 값). 연산자는 ==, !=, <, <=, >, >=, in, not in
+            column은 header명(include_column인 경우) 또는 읽어온 행에서의 열 번호(0부터, include_index면 0번이 index)
 
     Returns:
         dict (sheet_name : pandas.DataFrame)
         
     Raises:
-        ValueError: File path를 입력하지 않은 경우
-        FileNotFoundError: File path의 경로에 파일 찾을 수 없는 경우
+        ValueError: 입력받은 모든 sheet_name이 Workbook에 존재하지 않는 경우, workers 사용 시 파일 경로를 알 수 없는 경우
 
     """
+    options = dict(dtype=dtype, column_list=column_list, start_row=start_row, end_row=end_row, cell_range=cell_range, row_filter=row_filter)
+    if isinstance(workbook, str): # 경로가 주어지면 읽기 전용으로 열고 변환 후 닫는다
+        workbook = load_workbook_with_path(workbook, read_only=True)
+        try:
+            return convert_worksheet_to_df(workbook, sheet_name, include_index, include_column, chunk_size, workers, **options)
+        finally:
+            workbook.close()
     dfs = dict()
-    for sheet in sheet_name:
-        col = None
-        idx = None
-        datas = workbook[sheet].values
-        if sheet in workbook and datas is not None:
-            datas = list(datas)
-            if include_index and include_column:
-                col= datas[0][1:]
-                idx = [r[0] for r in datas]
-                datas = (islice(r, 1, None) for r in datas)
-            elif include_index:
-                idx = [r[0] for r in datas]
-                datas = (islice(r, 1, None) for r in datas)
-            elif include_column:
-                col= datas[0]
-            dfs[sheet]=pd.DataFrame(datas, index=idx, columns=col)
-
-    if dfs is None:
+    if workers is not None:
+        file_path = getattr(workbook, 'file_path', None)
+        if file_path is None:
+            raise ValueError("[Error] workers needs a workbook loaded by load_workbook_with_path")
+        sheets = [sheet for sheet in sheet_name if sheet in workbook]
+        if sheets:
+            with ProcessPoolExecutor(max_workers=min(workers, len(sheets))) as executor:
+                futures = [executor.submit(_convert_sheet_to_columns, file_path, sheet, include_index, include_column, chunk_size, options)
+                           for sheet in sheets]
+                for sheet, future in zip(sheets, futures):
+                    dfs[sheet] = _columns_to_df(future.result())
+    else:
+        dfs = _convert_sheets_sequential(workbook, sheet_name, include_index, include_column, chunk_size, options)
+
+    if not dfs:
         raise ValueError(f"All {sheet_name} is not exist")
     return dfs
 
-def save_excel(workbook, file_path=None, include_index=False, include_column=False):
-    """ Excel 파일을 file_path에 저장
+def _convert_sheets_sequential(workbook, sheet_name, include_index=False, include_column=False, chunk_size=default_chunk_size, options=None, cancel_event=None):
+    """ 현재 프로세스에서 Sheet를 하나씩 chunk 단위로 읽어 dict(sheet_name:DataFrame)으로 반환
+
+    cancel_event가 set 되면 다음 chunk를 읽기 전에 중단한다. (convert_worksheet_to_df_async의 취소/timeout)
 
     Args:
-        workbook (openpyxl.Workbook, optional): 저장할 Excel Workbook 객체
-        file_path (str, optional): 저장 위치 (C:\\Users\\...), 입력하지 않을 시 Default로 들어감.
+        workbook (openpyxl.Workbook): Workbook 객체
+        sheet_name (list): Excel Workbook의 Sheet명
         include_index (bool, optional): index 포함여부
         include_column (bool, optional): column(header) 포함여부
+        chunk_size (int, optional): 한 번에 DataFrame으로 변환할 최대 행 수
+        options (dict, optional): iter_worksheet_chunks에 넘길 나머지 옵션 (dtype, column_list 등)
+        cancel_event (threading.Event, optional): 중단 요청 event
 
-    """
-    try :
-        if file_path is None: # 파일 경로를 따로 주지 않은 경우
-            file_path = default_save_path
-        workbook.save(file_path)
-    except FileNotFoundError:
-        print('[Error] Excel file not found. check the file path')
-    except PermissionError:
-        print('[Error] Excel file is open or the same file name exists.')
-        
-def save_df_to_excel(df_dict, workbook, sheet_name=["Sheet"], file_path=None, include_index=False, include_column=False):
-    """ DataFrame를 Excel sheet에 저장
+    Returns:
+        dict (sheet_name : pandas.DataFrame)
 
-    Args:
-        df_dict (dict, optional): key:pandas.DataFrame
-        workbook (openpyxl.Workbook, optional): 저장할 Excel Workbook 객체
-        sheet_name (str, optional): 저장할 Excel Workbook sheet 이름
-        file_path (str, optional): 저장 위치 (C:\\Users\\...), 입력하지 않을 시 Default로 들어감.
-        include_index (bool, optional): index 포함여부
-        include_column (bool, optional): column(header) 포함여부
+    Raises:
+        concurrent.futures.CancelledError: cancel_event가 set 된 경우
 
     """
+    options = options or {}
+    dfs = dict()
     for sheet in sheet_name:
         if sheet not in workbook:
-            workbook.create_sheet(title=sheet_name)
-        for r in dataframe_to_rows(df_dict[sheet], index=include_index, header=include_column):
-            workbook[sheet].append(r)
-    save_excel(workbook,file_path,include_index,include_column)
\ No newline at end of file
+            continue
+        chunks = []
+        for chunk in iter_worksheet_chunks(workbook, sheet, chunk_size, include_index, include_column, **options):
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError(f"[Error] conversion of {sheet} is cancelled")
+            chunks.append(chunk)
+        if not chunks:
+            dfs[sheet] = pd.DataFrame()
+        elif len(chunks) == 1:
+            dfs[sheet] = chunks[0]
+        else:
+            with profiletool.span('concat'):
+                df = pd.concat(chunks)
+            if options.get('dtype') is not None: # chunk마다 category 값이 달라 object로 합쳐진 열을 다시 category로 변환
+                categories = {i: 'category' for i, column_dtype in enumerate(chunks[0].dtypes)
+                              if isinstance(column_dtype, pd.CategoricalDtype) and not isinstance(df.dtypes.iloc[i], pd.CategoricalDtype)}
+                df = _apply_column_dtypes(df, categories)
+            df.attrs.update(chunks[-1].attrs)
+            dfs[sheet] = df
+        del chunks
+    return dfs
+
+def _read_shared_strings(archive, limit=None):
+    """ sharedStrings.xml의 문자열 표를 순서대로 읽음 (서식이 있는 문자열은 글자만 이어붙임)
+
+    Args:
+        archive (zipfile.ZipFile): xlsx 압축파일
+        limit (int, optional): 앞에서부터 읽을 문자열 수. 이만큼 읽으면 나머지는 파싱하지 않는다. None이면 전체
+
+    Returns:
+        list (str)
+
+    """
+    workbook_part = _find_workbook_part(archive)
+    workbook_dir, workbook_file = posixpath.split(workbook_part)
+    rels_path = posixpath.join(workbook_dir, '_rels', f'{workbook_file}.rels')
+    part = posixpath.join(workbook_dir, 'sharedStrings.xml')
+    if rels_path in archive.namelist():
+        part = next((target for target in _read_relationships(archive, rels_path).values() if target.endswith('sharedStrings.xml')), part)
+    if part not in archive.namelist():
+        return []
+    si_tag, t_tag, r_tag = f'{SHEET_MAIN_NS}si', f'{SHEET_MAIN_NS}t', f'{SHEET_MAIN_NS}r'
+    strings = []
+    with archive.open(part) as source:
+        for _, element in ET.iterparse(source):
+            if element.tag != si_tag:
+                continue
+            text = element.find(t_tag)
+            if text is not None:
+                strings.append(text.text or '')
+            else: # 서식이 있는 문자열 (<r><t>..</t></r> 여러 개, 윗주 <rPh>는 제외)
+                strings.append(''.join(run.findtext(t_tag) or '' for run in element.iter(r_tag)))
+            element.clear()
+            if limit is not None and len(strings) >= limit:
+                break
+    return strings
+
+def _is_date1904(archive):
+    properties = ET.fromstring(archive.read(_find_workbook_part(archive))).find(f'{SHEET_MAIN_NS}workbookPr')
+    return properties is not None and properties.get('date1904') in ('1', 'true')
+
+class _ColumnBuffer:
+    """ Sheet 열 하나의 값을 행 순서대로 모으는 buffer
+
+    숫자/날짜는 array('d'), 문자열은 문자열 표의 번호 array('i')로 모으고
+    서로 다른 종류의 값이 섞이면 python 값 list(object)로 바꾼다. 빈 cell은 NaN, -1, None으로 채운다.
+    capacity(예상 행 수)를 주면 처음 값이 들어올 때 그 크기로 미리 채워두고 위치에 값을 넣으므로 buffer를 다시 할당하지 않는다.
+    """
+    __slots__ = ('kind', 'values', 'capacity')
+    MISSING = {'number': math.nan, 'date': math.nan, 'string': -1, 'object': None}
+
+    def __init__(self, capacity=0):
+        self.kind = None   # None, 'number', 'date', 'string', 'object'
+        self.values = None
+        self.capacity = capacity
+
+    def append(self, position, kind, value, strings):
+        if self.kind != kind and self.kind != 'object':
+            if self.kind is None:
+                self.kind = kind
+                self.values = array('d') if kind in ('number', 'date') else array('i') if kind == 'string' else []
+                if self.capacity:
+                    self.values.append(self.MISSING[kind])
+                    self.values *= self.capacity
+            else:
+                self._to_object(strings)
+        if self.kind == 'object' and kind != 'object':
+            value = _cell_to_python(kind, value, strings)
+        missing = position - len(self.values)
+        if missing < 0: # 미리 채워둔 위치
+            self.values[position] = value
+            return
+        if missing > 0:
+            self.values.extend([self.MISSING[self.kind]] * missing)
+        self.values.append(value)
+
+    def _to_object(self, strings):
+        self.values = [_cell_to_python(self.kind, value, strings) for value in self.values]
+        self.kind = 'object'
+
+    def to_array(self, length, strings):
+        """ length 행 길이의 numpy 배열로 변환 (숫자: float64 또는 결측이 없는 정수면 int64, 날짜: datetime64, 문자열: int32 번호)
+        """
+        if self.kind is None:
+            return np.full(length, None, dtype=object)
+        missing = length - len(self.values)
+        if missing > 0:
+            self.values.extend([self.MISSING[self.kind]] * missing)
+        elif missing < 0: # 예상 행 수보다 적게 읽은 경우
+            del self.values[length:]
+        if self.kind == 'object':
+            values = np.empty(length, dtype=object)
+            values[:] = self.values
+            return values
+        values = np.frombuffer(self.values, dtype=np.float64 if self.kind != 'string' else np.int32)
+        if self.kind == 'date':
+            return _serial_to_datetime(values, strings.date1904).to_numpy()
+        if self.kind == 'number' and not np.isnan(values).any() and (np.abs(values) < 2 ** 53).all() and (values == np.floor(values)).all():
+            return values.astype(np.int64)
+        return values
+
+class _StringTable(list):
+    """ 공유 문자열 표 + Sheet에 직접 들어있는 문자열(inlineStr, 수식 결과 등)을 합친 문자열 표
+
+    직접 들어있는 문자열도 같은 값이면 같은 번호(하나의 str 객체)를 사용한다.
+    """
+    def __init__(self, shared_strings, date1904=False):
+        super().__init__(shared_strings)
+        self.date1904 = date1904
+        self._codes = None # 문자열 : 번호 (처음 필요할 때 생성)
+
+    def code(self, text):
+        if self._codes is None:
+            self._codes = {value: code for code, value in reversed(list(enumerate(self)))}
+        code = self._codes.get(text)
+        if code is None:
+            code = self._codes[text] = len(self)
+            self.append(text)
+        return code
+
+def _codes_to_categorical(codes, string_table, max_ratio=None):
+    """ 문자열 표 번호 배열을 문자열 비교 없이 pandas.Categorical로 변환
+
+    사용된 번호만 category로 남기고 번호를 0부터 다시 매긴다. (category 순서는 문자열 표 순서)
+
+    Args:
+        codes (numpy.ndarray): 문자열 표 번호 (빈 cell은 -1)
+        string_table (numpy.ndarray): 문자열 표
+        max_ratio (float, optional): 고유값 수가 값 개수 * max_ratio보다 많으면 변환하지 않고 None 반환
+
+    Returns:
+        pandas.Categorical or None
+
+    """
+    present = codes >= 0
+    counts = np.bincount(codes[present], minlength=len(string_table))
+    used = np.flatnonzero(counts)
+    if max_ratio is not None and len(used) > present.sum() * max_ratio:
+        return None
+    categories = pd.Index(string_table[used])
+    if not categories.is_unique: # 공유 문자열 표에 같은 글자가 두 번 있는 경우 (서식만 다른 문자열)
+        values = string_table[codes]
+        values[~present] = None
+        return pd.Categorical(values)
+    mapping = np.full(len(string_table) + 1, -1, dtype=np.int32) # 마지막 칸은 -1(빈 cell)용
+    mapping[used] = np.arange(len(used), dtype=np.int32)
+    return pd.Categorical.from_codes(mapping[codes], categories)
+
+def _cell_to_python(kind, value, strings):
+    """ buffer에 들어가는 값(float, 문자열 번호)을 python 값으로 변환 (빈 cell은 None)
+    """
+    if kind == 'string':
+        return None if value < 0 else strings[value]
+    if math.isnan(value):
+        return None
+    if kind == 'date':
+        return _serial_to_datetime(np.array([value]), strings.date1904)[0].to_pydatetime()
+    return int(value) if value.is_integer() else value
+
+def _serial_to_datetime(serials, date1904=False):
+    if date1904:
+        return pd.to_datetime(serials, unit='D', origin='1904-01-01').round('ms')
+    serials = np.where((serials > 0) & (serials < 60), serials + 1, serials) # Excel 1900년 2월 29일 오류 보정
+    return pd.to_datetime(serials, unit='D', origin='1899-12-30').round('ms')
+
+def _read_sheet_buffers(archive, part, strings, date_styles, include_column=False, buffers=None, row_offset=0, shared_codes=None,
+                        column_names=None, capacity=0, date_offset=0):
+    """ Sheet XML을 한 cell씩 파싱하여 열(column)별 _ColumnBuffer에 바로 모음
+
+    buffers, row_offset 등을 넘기면 여러 파일의 Sheet를 같은 buffer에 이어서 모을 수 있다. (concat_workbooks)
+
+    Args:
+        archive (zipfile.ZipFile): xlsx 압축파일
+        part (str): Sheet XML 경로
+        strings (_StringTable): 문자열 표
+        date_styles (set): 날짜 형식 style 번호
+        include_column (bool, optional): 첫 행을 buffer에 넣지 않고 header(python 값 list)로 반환할지 여부
+        buffers (list, optional): 값을 이어서 넣을 _ColumnBuffer 목록. None이면 새로 만든다
+        row_offset (int, optional): 첫 데이터 행을 넣을 buffer 위치
+        shared_codes (list, optional): 이 파일의 공유 문자열 번호 : strings 번호. None이면 strings가 이 파일의 공유 문자열표
+        column_names (list, optional): include_column인 경우 header 이름으로 열을 맞출 전체 열 이름 목록 (새 이름은 뒤에 추가)
+        capacity (int, optional): 새 _ColumnBuffer를 미리 채워둘 행 수
+        date_offset (float, optional): 날짜 serial 값에 더할 일 수 (1904 날짜 체계 파일을 합치는 경우)
+
+    Returns:
+        tuple (header list or None, list(_ColumnBuffer), 데이터 행 수) : 행 번호는 Sheet의 첫 행(header 제외)부터 0으로 센다
+
+    """
+    c_tag, row_tag, v_tag, is_tag, t_tag = (f'{SHEET_MAIN_NS}{tag}' for tag in ('c', 'row', 'v', 'is', 't'))
+    from openpyxl.utils.cell import column_index_from_string
+    column_positions = dict() # 'AB' : 27
+    buffers = [] if buffers is None else buffers
+    header = [] if include_column else None
+    mapping = None # 이 파일의 열 위치 : buffer 위치 (column_names로 맞추는 경우)
+
+    def map_columns(mapped):
+        """ header[len(mapped):] 열을 column_names의 같은 이름 열에 대응 (없거나 이름이 없으면 새 열 추가) """
+        used = set(mapped)
+        for name in header[len(mapped):]:
+            position = next((i for i, known in enumerate(column_names) if name is not None and known == name and i not in used), None)
+            if position is None:
+                column_names.append(name)
+                position = len(column_names) - 1
+            used.add(position)
+            mapped.append(position)
+        return mapped
+    first_row = None
+    row_number = 0
+    column = 0
+    with archive.open(part) as source:
+        for event, element in ET.iterparse(source, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                if tag == row_tag:
+                    row_number = int(element.get('r', row_number + 1))
+                    if first_row is None:
+                        first_row = row_number
+                    column = 0
+                continue
+            if tag == c_tag:
+                reference = element.get('r')
+                if reference is None:
+                    column += 1
+                else:
+                    letters = reference.rstrip('0123456789')
+                    column = column_positions.get(letters)
+                    if column is None:
+                        column = column_positions[letters] = column_index_from_string(letters)
+                cell_type = element.get('t', 'n')
+                if cell_type == 'inlineStr':
+                    inline = element.find(is_tag)
+                    kind, value = 'string', strings.code(''.join(inline.itertext()) if inline is not None else '')
+                else:
+                    text = element.findtext(v_tag)
+                    if not text: # <v></v> (값이 저장되지 않은 수식 등)는 빈 cell
+                        element.clear()
+                        continue
+                    if cell_type == 'n':
+                        kind, value = 'number', float(text)
+                        if date_styles and int(element.get('s', 0)) in date_styles:
+                            kind, value = 'date', value + date_offset
+                    elif cell_type == 's':
+                        kind, value = 'string', int(text) if shared_codes is None else shared_codes[int(text)]
+                    elif cell_type == 'b':
+                        kind, value = 'object', text == '1'
+                    elif cell_type == 'd':
+                        kind, value = 'object', datetime.datetime.fromisoformat(text)
+                    else: # str (수식 결과 문자열), e (오류 값 #N/A 등)
+                        kind, value = 'string', strings.code(text)
+                if header is not None and row_number == first_row:
+                    header.extend([None] * (column - len(header)))
+                    header[column - 1] = value if kind == 'object' else _cell_to_python(kind, value, strings)
+                else:
+                    if column_names is not None:
+                        if mapping is None:
+                            mapping = map_columns([])
+                        if column > len(mapping): # header보다 오른쪽 열은 이름 없는 새 열
+                            header.extend([None] * (column - len(header)))
+                            map_columns(mapping)
+                        position = mapping[column - 1]
+                    else:
+                        position = column - 1
+                    while len(buffers) <= position:
+                        buffers.append(_ColumnBuffer(capacity))
+                    buffers[position].append(row_offset + row_number - first_row - (header is not None), kind, value, strings)
+                element.clear()
+            elif tag == row_tag:
+                element.clear()
+    length = 0 if first_row is None else row_number - first_row + 1 - (header is not None)
+    if column_names is not None:
+        if mapping is None and header:
+            map_columns([])
+        while len(buffers) < len(column_names):
+            buffers.append(_ColumnBuffer(capacity))
+    elif header is not None:
+        while len(buffers) < len(header):
+            buffers.append(_ColumnBuffer())
+        header.extend([None] * (len(buffers) - len(header)))
+    return header, buffers, length
+
+def _decode_string_columns(data, string_columns, string_table, string_dtype='object'):
+    """ data의 문자열 표 번호 열을 문자열(object) 또는 category 열로 바꿈 (string_dtype은 read_sheet_columns 참고)
+    """
+    for i in string_columns:
+        codes = data[i]
+        if string_dtype != 'object':
+            categorical = _codes_to_categorical(codes, string_table, category_max_ratio if string_dtype == 'auto' else None)
+            if categorical is not None:
+                data[i] = categorical
+                continue
+        values = string_table[codes]
+        values[codes < 0] = None
+        data[i] = values
+
+def _measure_sheet_columns(result, file_path, *args, **kwargs):
+    if isinstance(result, dict): # output='numpy'
+        rows, columns = (len(result['data'][0]) if result['data'] else 0), len(result['data'])
+    elif hasattr(result, 'num_rows'): # output='arrow'
+        rows, columns = result.num_rows, result.num_columns
+    else:
+        rows, columns = result.shape
+    return {'rows': rows, 'cells': rows * columns, 'bytes_read': os.path.getsize(file_path)}
+
+@profiletool.instrument(measure=_measure_sheet_columns)
+def read_sheet_columns(file_path, sheet_name='Sheet', include_index=False, include_column=False, output='pandas', string_dtype='object'):
+    """ Sheet XML을 직접 파싱하여 행(tuple)을 만들지 않고 열(column) 단위 배열로 읽어옴
+
+    cell 값을 열마다 숫자는 float64 buffer, 문자열은 문자열 표(공유 문자열) 번호 buffer로 바로 모으므로
+    convert_worksheet_to_df처럼 행 tuple을 만든 뒤 DataFrame으로 전치(transpose)하는 과정과 중복 할당이 없다.
+    결측 없는 정수 열은 int64, 날짜 형식 열은 datetime64, 종류가 섞인 열은 object가 된다.
+    같은 문자열은 문자열 표의 str 객체 하나를 공유하며, string_dtype='category'이면 문자열 표 번호를
+    그대로 category 번호로 사용하므로 "OK", "N/A" 처럼 반복되는 값이 많은 열의 메모리와 groupby/필터 시간이 줄어든다.
+    (수식은 저장된 결과 값을 읽으며, 열 범위는 A열부터 값이 있는 마지막 열까지, 행 범위는 Sheet의 첫 행부터이다.)
+
+    Args:
+        file_path (str): 읽어올 Excel(xlsx) 파일의 경로
+        sheet_name (str): 읽어올 Sheet명
+        include_index (bool, optional): 첫 열을 index로 사용할지 여부
+        include_column (bool, optional): 첫 행을 column(header)으로 사용할지 여부
+        output (str, optional): 반환 형식
+            'pandas' : pandas.DataFrame
+            'numpy' : dict (columns : list, index : numpy.ndarray or None, data : list(numpy.ndarray), strings : numpy.ndarray)
+                      문자열 열은 strings(문자열 표)의 번호 int32 배열이며 빈 cell은 -1
+            'arrow' : pyarrow.Table (문자열 열은 dictionary 배열, pyarrow 설치 필요)
+        string_dtype (str, optional): output='pandas'에서 문자열 열의 dtype
+            'object' : 문자열 (같은 값은 같은 str 객체)
+            'category' : 모든 문자열 열을 category로
+            'auto' : 고유값 비율이 category_max_ratio 이하인 문자열 열만 category로
+
+    Returns:
+        pandas.DataFrame or dict or pyarrow.Table
+
+    Raises:
+        ValueError: sheet_name이 파일에 존재하지 않거나 output, string_dtype이 잘못된 경우
+
+    """
+    if output not in ('pandas', 'numpy', 'arrow'):
+        raise ValueError(f"[Error] output should be one of pandas, numpy, arrow: {output}")
+    if string_dtype not in ('object', 'category', 'auto'):
+        raise ValueError(f"[Error] string_dtype should be one of object, category, auto: {string_dtype}")
+    with zipfile.ZipFile(file_path) as archive:
+        part = _read_workbook_manifest(archive).get(sheet_name)
+        if part is None:
+            raise ValueError(f"[Error] {sheet_name} is not exist")
+        with profiletool.span('read_shared_strings'):
+            strings = _StringTable(_read_shared_strings(archive), _is_date1904(archive))
+        with profiletool.span('parse_sheet'):
+            header, buffers, length = _read_sheet_buffers(archive, part, strings, set(_read_date_styles(archive)), include_column)
+
+    string_table = np.empty(len(strings), dtype=object)
+    string_table[:] = strings
+    with profiletool.span('build_arrays'):
+        data = [buffer.to_array(length, strings) for buffer in buffers]
+    string_columns = {i for i, buffer in enumerate(buffers) if buffer.kind == 'string'}
+    columns = header if header is not None else list(range(len(data)))
+
+    index = None
+    if include_index and data:
+        index = data.pop(0)
+        if 0 in string_columns:
+            index = np.where(index < 0, None, string_table[index])
+        string_columns = {i - 1 for i in string_columns if i > 0}
+        index_name, columns = columns[0], columns[1:]
+        if header is None:
+            columns = list(range(len(data)))
+
+    if output == 'numpy':
+        return {'columns': columns, 'index': index, 'data': data, 'strings': string_table}
+    if output == 'arrow':
+        pa = lazy_import('pyarrow')
+        arrays = [pa.DictionaryArray.from_arrays(pa.array(values, mask=values < 0), string_table) if i in string_columns else pa.array(values)
+                  for i, values in enumerate(data)]
+        if index is not None:
+            arrays.insert(0, pa.array(index))
+            columns = [index_name] + list(columns)
+        return pa.table(arrays, names=[str(column) for column in columns])
+    _decode_string_columns(data, string_columns, string_table, string_dtype)
+    if not data:
+        return pd.DataFrame(index=index)
+    df = pd.DataFrame(dict(enumerate(data)), index=index)
+    df.columns = columns
+    if index is not None:
+        df.index.name = index_name if header is not None else None
+    return df
+
+class _MappedFile(mmap.mmap):
+    """ zipfile.ZipFile에 넘길 수 있는 읽기 전용 memory-map 파일 (python 3.13 미만의 mmap에는 seekable이 없음)
+    """
+    def seekable(self):
+        return True
+
+def _iter_xml_events(source, events, read_size=64 * 1024):
+    """ 압축 해제 stream을 read_size씩 읽어 XML event를 순서대로 반환 (중간에 멈추면 나머지는 읽지 않는다)
+    """
+    parser = ET.XMLPullParser(events)
+    while True:
+        data = source.read(read_size)
+        if not data:
+            break
+        parser.feed(data)
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+def _measure_rows(result, *args, **kwargs):
+    return {'rows': len(result), 'cells': sum(len(row) for row in result)}
+
+@profiletool.instrument(measure=_measure_rows)
+def read_cell_range(file_path, sheet_name='Sheet', cell_range='A1'):
+    """ Workbook을 만들지 않고 Sheet의 지정한 범위 cell 값만 읽어옴
+
+    파일을 memory-map으로 열어 zip에서 해당 Sheet XML만 찾아 조금씩 압축을 풀며 파싱하고,
+    범위의 마지막 행을 지나면 즉시 멈춘다. 공유 문자열표도 범위에서 사용한 번호까지만 파싱하므로
+    요약 영역(A1:F20 등)을 읽는 시간은 Sheet 크기가 아닌 범위의 위치와 크기에 비례한다.
+    (수식은 저장된 결과 값을 읽는다.)
+
+    Args:
+        file_path (str): 읽어올 Excel(xlsx) 파일의 경로
+        sheet_name (str): 읽어올 Sheet명
+        cell_range (str): Excel 범위 ('A1:F20' 또는 'B3')
+
+    Returns:
+        list (tuple) : 범위의 행별 값. 빈 cell은 None
+
+    Raises:
+        ValueError: 파일 또는 sheet_name이 존재하지 않거나 cell_range가 잘못된 경우
+
+    """
+    from openpyxl.utils.cell import range_boundaries, column_index_from_string
+    from openpyxl.utils.datetime import from_excel, MAC_EPOCH, WINDOWS_EPOCH
+    try:
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+    except (ValueError, TypeError) as err:
+        raise ValueError(f"[Error] Invalid cell_range: {cell_range}") from err
+    if None in (min_col, min_row, max_col, max_row):
+        raise ValueError(f"[Error] cell_range should have both rows and columns: {cell_range}")
+    if not os.path.exists(file_path):
+        raise ValueError("[Error] Can't find the file from the given file path")
+
+    c_tag, row_tag, v_tag, is_tag = (f'{SHEET_MAIN_NS}{tag}' for tag in ('c', 'row', 'v', 'is'))
+    grid = [[None] * (max_col - min_col + 1) for _ in range(max_row - min_row + 1)]
+    pending = [] # (행 위치, 열 위치, kind, 값) : 공유 문자열/날짜 변환이 필요한 cell
+    with open(file_path, 'rb') as f, _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, zipfile.ZipFile(mapped) as archive:
+        part = _read_workbook_manifest(archive).get(sheet_name)
+        if part is None:
+            raise ValueError(f"[Error] {sheet_name} is not exist")
+        row_number = 0
+        in_range = False
+        with archive.open(part) as source, profiletool.span('parse_sheet'):
+            for event, element in _iter_xml_events(source, ('start', 'end')):
+                tag = element.tag
+                if event == 'start':
+                    if tag == row_tag:
+                        row_number = int(element.get('r', row_number + 1))
+                        if row_number > max_row: # 범위를 지나면 나머지 XML은 압축도 풀지 않는다
+                            break
+                        in_range = row_number >= min_row
+                        column = 0
+                    continue
+                if tag == row_tag:
+                    element.clear()
+                    continue
+                if tag != c_tag or not in_range:
+                    continue
+                reference = element.get('r')
+                # r 속성은 생략될 수 있으므로 없으면 앞 cell 다음 열로 본다
+                column = column + 1 if reference is None else column_index_from_string(reference.rstrip('0123456789'))
+                if not min_col <= column <= max_col:
+                    element.clear()
+                    continue
+                cell_type = element.get('t', 'n')
+                position = (row_number - min_row, column - min_col)
+                if cell_type == 'inlineStr':
+                    inline = element.find(is_tag)
+                    grid[position[0]][position[1]] = ''.join(inline.itertext()) if inline is not None else ''
+                else:
+                    text = element.findtext(v_tag)
+                    if not text: # <v> 없음 또는 <v></v> (값이 저장되지 않은 수식 등)는 None
+                        pass
+                    elif cell_type == 'n':
+                        value = float(text) if '.' in text or 'E' in text or 'e' in text else int(text)
+                        if element.get('s', '0') != '0':
+                            pending.append((position, 'number', int(element.get('s')), value))
+                        grid[position[0]][position[1]] = value
+                    elif cell_type == 's':
+                        pending.append((position, 'string', None, int(text)))
+                    elif cell_type == 'b':
+                        grid[position[0]][position[1]] = text == '1'
+                    elif cell_type == 'd':
+                        grid[position[0]][position[1]] = datetime.datetime.fromisoformat(text)
+                    else: # str (수식 결과 문자열), e (오류 값 #N/A 등)
+                        grid[position[0]][position[1]] = text
+                element.clear()
+
+        string_codes = [value for _, kind, _, value in pending if kind == 'string']
+        if string_codes:
+            with profiletool.span('read_shared_strings'):
+                strings = _read_shared_strings(archive, limit=max(string_codes) + 1)
+        if any(kind == 'number' for _, kind, _, _ in pending):
+            date_styles = set(_read_date_styles(archive))
+            epoch = MAC_EPOCH if _is_date1904(archive) else WINDOWS_EPOCH
+    for (row, column), kind, style, value in pending:
+        if kind == 'string':
+            grid[row][column] = strings[value] if value < len(strings) else None
+        elif style in date_styles:
+            grid[row][column] = from_excel(value, epoch)
+    return [tuple(row) for row in grid]
+
+def _read_sheet_dimension(archive, part):
+    """ Sheet XML 앞부분의 <dimension ref="A1:F100">만 읽어 (행 수, 열 수)를 반환 (없으면 None)
+    """
+    from openpyxl.utils.cell import range_boundaries
+    dimension_tag, data_tag = f'{SHEET_MAIN_NS}dimension', f'{SHEET_MAIN_NS}sheetData'
+    with archive.open(part) as source:
+        for _, element in _iter_xml_events(source, ('start',), read_size=4096):
+            if element.tag == data_tag:
+                return None
+            if element.tag == dimension_tag:
+                try:
+                    min_col, min_row, max_col, max_row = range_boundaries(element.get('ref', ''))
+                except (ValueError, TypeError):
+                    return None
+                if None in (min_col, min_row, max_col, max_row):
+                    return None
+                return max_row - min_row + 1, max_col - min_col + 1
+    return None
+
+def _measure_concat(result, *args, **kwargs):
+    return {'rows': result.shape[0], 'cells': result.size}
+
+@profiletool.instrument(measure=_measure_concat)
+def concat_workbooks(file_paths, sheet_name='Sheet', include_column=False, source_column='source_file', string_dtype='object'):
+    """ 여러 Excel 파일의 같은 Sheet를 파일별 DataFrame 없이 하나의 DataFrame으로 이어붙임
+
+    먼저 각 Sheet XML의 dimension으로 전체 행 수를 구해 열 buffer를 그 크기로 미리 만들고,
+    파일마다 Sheet XML을 파싱한 값을 바로 이어서 넣으므로 pd.concat처럼 파일 수만큼 다시 할당/복사하지 않는다.
+    (dimension이 없는 파일이 있으면 buffer를 늘려가며 넣는다.)
+    공유 문자열표는 파일 사이에 합쳐지므로 같은 문자열은 하나의 str(또는 category)로 저장된다.
+    include_column이면 header 이름으로 열을 맞추고(없는 열은 결측), 아니면 열 위치로 맞춘다.
+
+    Args:
+        file_paths (list or str): Excel(xlsx) 파일 경로 목록 또는 폴더 경로/glob 패턴 (list_excel_files 참고)
+        sheet_name (str): 읽어올 Sheet명
+        include_column (bool, optional): 각 파일의 첫 행을 column(header)으로 사용할지 여부
+        source_column (str, optional): 행의 원본 파일 경로를 기록할 category 열 이름. None이면 추가하지 않음
+        string_dtype (str, optional): 문자열 열의 dtype. read_sheet_columns 참고
+
+    Returns:
+        pandas.DataFrame
+
+    Raises:
+        ValueError: 파일이 없거나 sheet_name이 어떤 파일에 존재하지 않는 경우
+
+    """
+    if isinstance(file_paths, str):
+        file_paths = list_excel_files(file_paths)
+    file_paths = list(file_paths)
+    if not file_paths:
+        raise ValueError("[Error] There is no excel file to concat")
+
+    with profiletool.span('read_dimensions'):
+        capacity = 0
+        for file_path in file_paths:
+            with zipfile.ZipFile(file_path) as archive:
+                part = _read_workbook_manifest(archive).get(sheet_name)
+                if part is None:
+                    raise ValueError(f"[Error] {sheet_name} is not exist in {file_path}")
+                dimension = _read_sheet_dimension(archive, part)
+            if dimension is None:
+                capacity = 0
+                break
+            capacity += max(dimension[0] - bool(include_column), 0)
+
+    strings = _StringTable([]) # 모든 파일의 문자열을 합친 표 (날짜는 1900 체계로 맞춘다)
+    buffers = []
+    column_names = [] if include_column else None
+    lengths = []
+    with profiletool.span('parse_sheets'):
+        for file_path in file_paths:
+            with zipfile.ZipFile(file_path) as archive:
+                part = _read_workbook_manifest(archive).get(sheet_name)
+                shared_codes = [strings.code(text) for text in _read_shared_strings(archive)]
+                date_offset = 1462 if _is_date1904(archive) else 0
+                _, _, length = _read_sheet_buffers(archive, part, strings, set(_read_date_styles(archive)), include_column, buffers,
+                                                   sum(lengths), shared_codes, column_names, capacity, date_offset)
+            lengths.append(length)
+
+    total = sum(lengths)
+    string_table = np.empty(len(strings), dtype=object)
+    string_table[:] = strings
+    with profiletool.span('build_arrays'):
+        data = [buffer.to_array(total, strings) for buffer in buffers]
+        _decode_string_columns(data, {i for i, buffer in enumerate(buffers) if buffer.kind == 'string'}, string_table, string_dtype)
+    columns = column_names if include_column else list(range(len(data)))
+    if source_column is not None:
+        sources = pd.Index(file_paths).unique()
+        data.append(pd.Categorical.from_codes(np.repeat(sources.get_indexer(file_paths), lengths), sources))
+        columns = list(columns) + [source_column]
+    if not data:
+        return pd.DataFrame()
+    df = pd.DataFrame(dict(enumerate(data)))
+    df.columns = columns
+    return df
+
+@profiletool.instrument(measure=_measure_concat)
+def join_workbooks(file_paths, key_columns, sheet_name='Sheet', how='outer', suffixes=None, string_dtype='object'):
+    """ 여러 Excel 파일의 같은 Sheet를 key 열 기준으로 옆으로 합침 (파일별 DataFrame 없이 열 배열끼리 맞춤)
+
+    각 파일을 read_sheet_columns(output='numpy')로 열 배열만 읽고, key로 결과 행 순서를 정한 뒤
+    각 파일의 열을 한 번씩만 골라(take) 담는다. 문자열 열은 골라낸 행만 문자열로 바꾼다.
+    각 파일의 첫 행은 header여야 하며, 파일 안에서 key 값은 중복되지 않아야 한다.
+
+    Args:
+        file_paths (list or str): Excel(xlsx) 파일 경로 목록 또는 폴더 경로/glob 패턴 (list_excel_files 참고)
+        key_columns (list): key 열 이름
+        sheet_name (str): 읽어올 Sheet명
+        how (str, optional): 'outer'(모든 key), 'inner'(모든 파일에 있는 key), 'left'(첫 파일의 key)
+        suffixes (list, optional): 파일별로 key가 아닌 열 이름 뒤에 붙일 문자열. 입력하지 않을 시 '_파일명'
+        string_dtype (str, optional): 문자열 열의 dtype. read_sheet_columns 참고
+
+    Returns:
+        pandas.DataFrame : key 열 + 파일별 나머지 열
+
+    Raises:
+        ValueError: how가 잘못되었거나 key 열이 없거나 key 값이 중복된 경우
+
+    """
+    if how not in ('outer', 'inner', 'left'):
+        raise ValueError(f"[Error] how should be one of outer, inner, left: {how}")
+    if isinstance(file_paths, str):
+        file_paths = list_excel_files(file_paths)
+    file_paths = list(file_paths)
+    if not file_paths:
+        raise ValueError("[Error] There is no excel file to join")
+    if suffixes is None:
+        suffixes = [f'_{os.path.splitext(os.path.basename(file_path))[0]}' for file_path in file_paths]
+
+    def decode(values, string_table):
+        if values.dtype == np.int32: # 문자열 표 번호 열
+            decoded = string_table[values]
+            decoded[values < 0] = None
+            return decoded
+        return values
+
+    sheets, keys = [], []
+    for file_path in file_paths:
+        sheet = read_sheet_columns(file_path, sheet_name, include_column=True, output='numpy')
+        positions = []
+        for key in key_columns:
+            if key not in sheet['columns']:
+                raise ValueError(f"[Error] {key} is not exist in {file_path}")
+            positions.append(sheet['columns'].index(key))
+        key_values = [decode(sheet['data'][position], sheet['strings']) for position in positions]
+        key_index = pd.MultiIndex.from_arrays(key_values, names=key_columns) if len(key_columns) > 1 else pd.Index(key_values[0], name=key_columns[0])
+        if not key_index.is_unique:
+            raise ValueError(f"[Error] key_columns {key_columns} are not unique in {file_path}")
+        sheets.append((sheet, positions))
+        keys.append(key_index)
+
+    with profiletool.span('align_keys'):
+        result_keys = keys[0]
+        for key_index in keys[1:]:
+            if how == 'outer':
+                result_keys = result_keys.union(key_index, sort=False)
+            elif how == 'inner':
+                result_keys = result_keys.intersection(key_index, sort=False)
+        indexers = [key_index.get_indexer(result_keys) for key_index in keys]
+
+    data, columns = dict(), []
+    for position, key in enumerate(key_columns):
+        data[len(columns)] = result_keys.get_level_values(position) if len(key_columns) > 1 else result_keys
+        columns.append(key)
+    with profiletool.span('take_columns'):
+        for (sheet, positions), indexer, suffix in zip(sheets, indexers, suffixes):
+            missing = indexer < 0
+            for position, (name, values) in enumerate(zip(sheet['columns'], sheet['data'])):
+                if position in positions:
+                    continue
+                if values.dtype == np.int32: # 문자열은 고른 행의 번호만 남긴 뒤 변환
+                    codes = np.where(missing, -1, values[indexer]).astype(np.int32)
+                    column = [codes]
+                    _decode_string_columns(column, {0}, sheet['strings'], string_dtype)
+                    values = column[0]
+                else:
+                    values = pd.api.extensions.take(values, indexer, allow_fill=True)
+                data[len(columns)] = values
+                columns.append(f'{name}{suffix}')
+    df = pd.DataFrame({i: np.asarray(values) if isinstance(values, pd.Index) else values for i, values in data.items()})
+    df.columns = columns
+    return df
+
+def _file_digest(file_path, stat):
+    """ 파일 내용의 sha1 hash 반환 (같은 프로세스에서 size, mtime이 같으면 다시 읽지 않음)
+
+    Args:
+        file_path (str): 파일 경로
+        stat (os.stat_result): file_path의 os.stat 결과
+
+    Returns:
+        str
+
+    """
+    memo_key = (file_path, stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _file_digest_memo:
+        digest = hashlib.sha1()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        _file_digest_memo[memo_key] = digest.hexdigest()
+    return _file_digest_memo[memo_key]
+
+def _sheet_cache_key(file_path, sheet, include_index, include_column):
+    """ 파일 경로, 크기, 수정시각, 내용 hash와 변환 옵션으로 Sheet 캐시 key 생성
+
+    Args:
+        file_path (str): Excel 파일의 절대 경로
+        sheet (str): Sheet명
+        include_index (bool): index 포함여부
+        include_column (bool): column(header) 포함여부
+
+    Returns:
+        str
+
+    """
+    stat = os.stat(file_path)
+    source = f"{file_path}|{stat.st_size}|{stat.st_mtime_ns}|{_file_digest(file_path, stat)}|{sheet}|{include_index}|{include_column}"
+    return hashlib.sha1(source.encode('utf8')).hexdigest()
+
+def _save_df_to_cache(df, entry_path):
+    """ DataFrame을 열별 .npy 파일 묶음으로 캐시 폴더에 저장
+
+    숫자/날짜 열은 memory-map으로 읽을 수 있는 .npy로, 문자열 등 python 객체 열과 index/column은 pickle로 저장한다.
+    임시 폴더에 모두 기록한 뒤 이름을 바꾸므로 중간에 실패해도 깨진 캐시가 남지 않는다.
+
+    Args:
+        df (pandas.DataFrame): 저장할 DataFrame
+        entry_path (str): 캐시 항목 폴더 경로
+
+    """
+    temp_path = f"{entry_path}.{os.getpid()}.tmp"
+    os.makedirs(temp_path, exist_ok=True)
+    mmap_flags = []
+    for i in range(df.shape[1]):
+        values = df.iloc[:, i].to_numpy()
+        mmap_flags.append(not values.dtype.hasobject)
+        np.save(os.path.join(temp_path, f'col_{i}.npy'), values, allow_pickle=True)
+    pd.to_pickle(df.columns, os.path.join(temp_path, 'columns.pkl'))
+    pd.to_pickle(df.index, os.path.join(temp_path, 'index.pkl'))
+    with open(os.path.join(temp_path, 'meta.json'), 'w', encoding='utf8') as f:
+        json.dump({'mmap': mmap_flags}, f)
+    try:
+        os.replace(temp_path, entry_path)
+    except OSError: # 다른 프로세스가 먼저 같은 캐시를 만든 경우
+        shutil.rmtree(temp_path, ignore_errors=True)
+
+def _load_df_from_cache(entry_path):
+    """ 캐시 폴더의 .npy 파일 묶음을 DataFrame으로 읽어옴 (숫자/날짜 열은 memory-map)
+
+    Args:
+        entry_path (str): 캐시 항목 폴더 경로
+
+    Returns:
+        pandas.DataFrame or None : 캐시가 없는 경우 None
+
+    """
+    meta_path = os.path.join(entry_path, 'meta.json')
+    try:
+        with open(meta_path, encoding='utf8') as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    os.utime(meta_path) # LRU 정리를 위해 마지막 사용 시각 갱신
+    columns = pd.read_pickle(os.path.join(entry_path, 'columns.pkl'))
+    index = pd.read_pickle(os.path.join(entry_path, 'index.pkl'))
+    datas = {i: np.load(os.path.join(entry_path, f'col_{i}.npy'), mmap_mode='r' if mmap else None, allow_pickle=not mmap)
+             for i, mmap in enumerate(meta['mmap'])}
+    if not datas:
+        return pd.DataFrame()
+    df = pd.DataFrame(datas, index=index, copy=False)
+    df.columns = columns
+    return df
+
+def _evict_sheet_cache(cache_directory, max_cache_bytes):
+    """ 캐시 폴더 전체 크기가 max_cache_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+
+    Args:
+        cache_directory (str): 캐시 폴더 경로
+        max_cache_bytes (int): 캐시의 최대 크기
+
+    """
+    entries = []
+    for entry in os.scandir(cache_directory):
+        meta_path = os.path.join(entry.path, 'meta.json')
+        if not entry.is_dir() or not os.path.exists(meta_path):
+            continue
+        size = sum(f.stat().st_size for f in os.scandir(entry.path))
+        entries.append((os.stat(meta_path).st_mtime, size, entry.path))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, entry_path in sorted(entries):
+        if total_size <= max_cache_bytes:
+            break
+        shutil.rmtree(entry_path, ignore_errors=True)
+        total_size -= size
+
+def load_df_with_cache(file_path, sheet_name=['Sheet'], include_index=False, include_column=False, cache_directory=None, max_cache_bytes=None):
+    """ 변환된 Sheet를 디스크에 캐시하여 같은 파일을 다시 읽을 때 XML 파싱을 생략
+
+    파일 경로, 크기, 수정시각, 내용 hash와 include_index/include_column 옵션이 같으면
+    이전에 변환한 열별 .npy 파일을 읽어오며 숫자/날짜 열은 memory-map으로 읽는다.
+    캐시 전체 크기가 max_cache_bytes를 넘으면 오래 사용하지 않은 Sheet부터 삭제한다.
+    memory-map으로 읽은 열은 읽기 전용이므로 수정하려면 df.copy()를 사용하라.
+
+    Args:
+        file_path (str): 불러올 Excel 파일의 경로
+        sheet_name (list): Excel Workbook의 Sheet명
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        cache_directory (str, optional): 캐시 폴더. 입력하지 않을 시 default_cache_directory
+        max_cache_bytes (int, optional): 캐시의 최대 크기. 입력하지 않을 시 default_cache_max_bytes
+
+    Returns:
+        dict (sheet_name : pandas.DataFrame)
+
+    Raises:
+        ValueError: 입력받은 모든 sheet_name이 Workbook에 존재하지 않는 경우
+
+    """
+    if file_path is None:
+        raise ValueError("[Error] Should be given the excel file name")
+    file_path = os.path.abspath(file_path)
+    if not os.path.exists(file_path):
+        raise ValueError("[Error] Can't find the file from the given file path")
+    cache_directory = cache_directory or default_cache_directory
+    os.makedirs(cache_directory, exist_ok=True)
+
+    dfs = dict()
+    entry_paths = {sheet: os.path.join(cache_directory, _sheet_cache_key(file_path, sheet, include_index, include_column))
+                   for sheet in sheet_name}
+    missing = []
+    for sheet in sheet_name:
+        df = _load_df_from_cache(entry_paths[sheet])
+        if df is None:
+            missing.append(sheet)
+        else:
+            dfs[sheet] = df
+    if missing:
+        converted = convert_worksheet_to_df(file_path, missing, include_index, include_column)
+        for sheet, df in converted.items():
+            _save_df_to_cache(df, entry_paths[sheet])
+            dfs[sheet] = df
+        _evict_sheet_cache(cache_directory, max_cache_bytes or default_cache_max_bytes)
+    return {sheet: dfs[sheet] for sheet in sheet_name if sheet in dfs}
+
+def load_df_index_with_cache(file_path, sheet_name, key_columns, include_index=False, include_column=False, sorted_index=False, cache_directory=None):
+    """ load_df_with_cache로 Sheet를 읽고 key 열의 pandastool.DataFrameIndex를 캐시에 함께 저장/재사용
+
+    index는 Sheet 캐시 항목 폴더에 저장되므로 파일이 바뀌거나 캐시가 정리되면 함께 무효화된다.
+
+    Args:
+        file_path (str): 불러올 Excel 파일의 경로
+        sheet_name (str): Excel Workbook의 Sheet명
+        key_columns (list): key로 사용할 열 이름 목록
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        sorted_index (bool, optional): 범위 검색용 정렬 index 생성 여부
+        cache_directory (str, optional): 캐시 폴더. 입력하지 않을 시 default_cache_directory
+
+    Returns:
+        tuple (pandas.DataFrame, pandastool.DataFrameIndex)
+
+    Raises:
+        ValueError: sheet_name이 Workbook에 존재하지 않는 경우
+
+    """
+    import pandastool # pandastool은 import 시 출력 설정을 바꾸므로 필요할 때만 불러온다
+    df = load_df_with_cache(file_path, [sheet_name], include_index, include_column, cache_directory)[sheet_name]
+    entry_path = os.path.join(cache_directory or default_cache_directory,
+                              _sheet_cache_key(os.path.abspath(file_path), sheet_name, include_index, include_column))
+    index_name = hashlib.sha1(f"{list(key_columns)}|{sorted_index}".encode('utf8')).hexdigest()
+    index_path = os.path.join(entry_path, f'df_index_{index_name}.pkl')
+    if os.path.exists(index_path):
+        return df, pandastool.DataFrameIndex.load(index_path)
+    index = pandastool.build_df_index(df, key_columns, sorted_index)
+    if os.path.isdir(entry_path):
+        index.save(index_path)
+    return df, index
+
+def clear_df_cache(cache_directory=None):
+    """ load_df_with_cache의 캐시 폴더를 모두 삭제
+
+    Args:
+        cache_directory (str, optional): 캐시 폴더. 입력하지 않을 시 default_cache_directory
+
+    """
+    shutil.rmtree(cache_directory or default_cache_directory, ignore_errors=True)
+
+def list_excel_files(path, pattern='*.xlsx'):
+    """ 폴더 또는 glob 패턴에 해당하는 Excel 파일 경로 목록 반환
+
+    Args:
+        path (str): 폴더 경로 또는 glob 패턴 (C:\\Users\\*\\HPUX_*.xlsx)
+        pattern (str, optional): path가 폴더인 경우 사용할 파일명 패턴
+
+    Returns:
+        list (str) : 정렬된 파일 경로 목록. Excel이 만드는 임시파일(~$)은 제외한다.
+
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, pattern)
+    return sorted(file_path for file_path in glob.glob(path)
+                  if not os.path.basename(file_path).startswith('~$'))
+
+def _convert_file_to_df(file_path, sheet_name=None, include_index=False, include_column=False, chunk_size=default_chunk_size):
+    """ Excel 파일 하나를 읽기 전용으로 열어 dict(sheet_name:DataFrame)로 변환
+
+    Args:
+        file_path (str): 읽어올 Excel 파일의 경로
+        sheet_name (list, optional): 변환할 Sheet명. None이면 모든 Sheet
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        chunk_size (int, optional): 한 번에 DataFrame으로 변환할 최대 행 수
+
+    Returns:
+        dict (sheet_name : pandas.DataFrame)
+
+    """
+    workbook = load_workbook_with_path(file_path, read_only=True)
+    try:
+        sheets = workbook.sheetnames if sheet_name is None else sheet_name
+        return convert_worksheet_to_df(workbook, sheets, include_index, include_column, chunk_size)
+    finally:
+        workbook.close()
+
+def iter_workbooks_in_directory(path, sheet_name=None, include_index=False, include_column=False, workers=4, use_process=False, pattern='*.xlsx'):
+    """ 폴더의 Excel 파일들을 병렬로 읽어 변환이 끝나는 순서대로 반환
+
+    동시에 처리 중인 파일 수는 workers의 2배로 제한하므로 파일이 많아도 메모리가 일정하다.
+    파일 하나에서 오류가 나도 전체 작업을 중단하지 않고 해당 파일의 오류만 반환한다.
+
+    Args:
+        path (str): 폴더 경로 또는 glob 패턴
+        sheet_name (list, optional): 변환할 Sheet명. None이면 파일의 모든 Sheet
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        workers (int, optional): 동시에 사용할 최대 thread/process 수
+        use_process (bool, optional): True이면 thread 대신 process pool 사용 (CPU 사용량이 큰 경우)
+        pattern (str, optional): path가 폴더인 경우 사용할 파일명 패턴
+
+    Yields:
+        tuple (file_path, dict(sheet_name : pandas.DataFrame) or None, Exception or None)
+
+    """
+    file_paths = iter(list_excel_files(path, pattern))
+    executor_class = ProcessPoolExecutor if use_process else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        pending = dict()
+        while True:
+            for file_path in islice(file_paths, workers * 2 - len(pending)):
+                future = executor.submit(_convert_file_to_df, file_path, sheet_name, include_index, include_column)
+                pending[future] = file_path
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_path = pending.pop(future)
+                try:
+                    yield file_path, future.result(), None
+                except Exception as err:
+                    yield file_path, None, err
+
+def load_workbooks_in_directory(path, sheet_name=None, include_index=False, include_column=False, workers=4, use_process=False, pattern='*.xlsx'):
+    """ 폴더의 Excel 파일들을 병렬로 읽어 파일별 dict(sheet_name:DataFrame)로 반환
+
+    Args:
+        path (str): 폴더 경로 또는 glob 패턴
+        sheet_name (list, optional): 변환할 Sheet명. None이면 파일의 모든 Sheet
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        workers (int, optional): 동시에 사용할 최대 thread/process 수
+        use_process (bool, optional): True이면 thread 대신 process pool 사용
+        pattern (str, optional): path가 폴더인 경우 사용할 파일명 패턴
+
+    Returns:
+        tuple (dict(file_path : dict(sheet_name : pandas.DataFrame)), dict(file_path : Exception))
+
+    """
+    results, errors = dict(), dict()
+    for file_path, dfs, err in iter_workbooks_in_directory(path, sheet_name, include_index, include_column, workers, use_process, pattern):
+        if err is None:
+            results[file_path] = dfs
+        else:
+            errors[file_path] = err
+    return results, errors
+
+def _resolve_compression(compression=None, compress_level=None):
+    """ 저장 시 사용할 zip 압축 방식과 수준을 확인 (None이면 default_compression, default_compress_level)
+
+    Args:
+        compression (str, optional): 'deflate' 또는 'stored'(압축하지 않음)
+        compress_level (int, optional): deflate 압축 수준 0~9
+
+    Returns:
+        tuple (zipfile 압축 방식, 압축 수준 or None)
+
+    Raises:
+        ValueError: compression 또는 compress_level이 잘못된 경우
+
+    """
+    compression = default_compression if compression is None else compression
+    compress_level = default_compress_level if compress_level is None else compress_level
+    if compression not in ZIP_COMPRESSION:
+        raise ValueError(f"[Error] compression should be one of {list(ZIP_COMPRESSION)}: {compression}")
+    if compress_level is not None and not 0 <= compress_level <= 9:
+        raise ValueError(f"[Error] compress_level should be between 0 and 9: {compress_level}")
+    return ZIP_COMPRESSION[compression], compress_level if compression == 'deflate' else None
+
+def _save_workbook_compressed(workbook, file_path, method, level):
+    """ openpyxl.Workbook.save와 같지만 zip 압축 방식/수준을 지정하여 저장
+    """
+    from openpyxl.writer.excel import ExcelWriter
+    if workbook.read_only:
+        raise TypeError("Workbook is read-only")
+    if workbook.write_only and not workbook.worksheets:
+        workbook.create_sheet()
+    archive = zipfile.ZipFile(file_path, 'w', method, allowZip64=True, compresslevel=level)
+    workbook.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
+    ExcelWriter(workbook, archive).save() # 저장 후 archive를 닫는다
+
+def _measure_file_written(result, workbook, file_path=None, *args, **kwargs):
+    file_path = default_save_path if file_path is None else file_path
+    return {'bytes_written': os.path.getsize(file_path)} if os.path.exists(file_path) else {}
+
+@profiletool.instrument(measure=_measure_file_written)
+def save_excel(workbook, file_path=None, include_index=False, include_column=False, compression=None, compress_level=None):
+    """ Excel 파일을 file_path에 저장
+
+    여러 번 다시 쓰고 곧 다시 읽는 중간 파일은 compression='stored' 또는 compress_level=1로 압축 시간을 줄이고,
+    보관용 보고서는 compress_level=9로 파일 크기를 줄여라. (benchmarktool.py의 write_stored, write_deflate_* 결과 참고)
+
+    Args:
+        workbook (openpyxl.Workbook, optional): 저장할 Excel Workbook 객체
+        file_path (str, optional): 저장 위치 (C:\\Users\\...), 입력하지 않을 시 Default로 들어감.
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        compression (str, optional): zip 압축 방식 'deflate' 또는 'stored'(압축하지 않음). 입력하지 않을 시 default_compression
+        compress_level (int, optional): deflate 압축 수준 (1: 빠름 ~ 9: 작은 파일). 입력하지 않을 시 default_compress_level
+
+    Raises:
+        ValueError: compression 또는 compress_level이 잘못된 경우
+
+    """
+    method, level = _resolve_compression(compression, compress_level)
+    try :
+        if file_path is None: # 파일 경로를 따로 주지 않은 경우
+            file_path = default_save_path
+        if method == zipfile.ZIP_DEFLATED and level is None: # openpyxl 기본 설정
+            workbook.save(file_path)
+        else:
+            _save_workbook_compressed(workbook, file_path, method, level)
+    except FileNotFoundError:
+        print('[Error] Excel file not found. check the file path')
+    except PermissionError:
+        print('[Error] Excel file is open or the same file name exists.')
+        
+def _measure_df_written(result, df_dict, workbook=None, sheet_name=["Sheet"], file_path=None, *args, **kwargs):
+    counters = {'rows': sum(len(df_dict[sheet]) for sheet in sheet_name), 'cells': sum(df_dict[sheet].size for sheet in sheet_name)}
+    counters.update(_measure_file_written(result, workbook, file_path))
+    return counters
+
+@profiletool.instrument(measure=_measure_df_written)
+def save_df_to_excel(df_dict, workbook, sheet_name=["Sheet"], file_path=None, include_index=False, include_column=False, incremental=False, key_columns=None,
+                     workers=None, compression=None, compress_level=None):
+    """ DataFrame를 Excel sheet에 저장
+
+    행 수가 많고 새 파일로 저장하는 경우 stream_df_to_excel을 사용하라.
+    incremental이면 workbook은 사용하지 않고 file_path의 기존 Sheet와 비교하여
+    새로 추가/변경된 행만 해당 Sheet XML에 반영한다. (sync_df_to_excel 참고)
+    workers를 지정하면 workbook은 사용하지 않고 Sheet마다 별도 프로세스에서 XML을 만들어 새 파일로 저장한다. (parallel_df_to_excel 참고)
+
+    Args:
+        df_dict (dict, optional): key:pandas.DataFrame
+        workbook (openpyxl.Workbook, optional): 저장할 Excel Workbook 객체
+        sheet_name (str, optional): 저장할 Excel Workbook sheet 이름
+        file_path (str, optional): 저장 위치 (C:\\Users\\...), 입력하지 않을 시 Default로 들어감.
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        incremental (bool, optional): 기존 파일에 변경분만 반영할지 여부
+        key_columns (list, optional): incremental에서 같은 행을 판단할 key 열 이름. None이면 행 전체 값으로 비교
+        workers (int, optional): Sheet를 병렬로 기록할 최대 프로세스 수. None이면 workbook에 순차 기록
+        compression (str, optional): zip 압축 방식. save_excel 참고 (incremental에서는 기존 파일의 압축 방식을 유지)
+        compress_level (int, optional): deflate 압축 수준. save_excel 참고
+
+    Returns:
+        dict (sheet_name : dict(appended, updated)) : incremental인 경우 Sheet별 추가/변경 행 수
+
+    """
+    if incremental:
+        return {sheet: sync_df_to_excel(df_dict[sheet], file_path, sheet, key_columns, include_index, include_column)
+                for sheet in sheet_name}
+    if workers is not None:
+        return parallel_df_to_excel(df_dict, sheet_name, file_path, include_index, include_column, workers,
+                                    compression=compression, compress_level=compress_level)
+    for sheet in sheet_name:
+        if sheet not in workbook:
+            workbook.create_sheet(title=sheet)
+        from openpyxl.utils.dataframe import dataframe_to_rows
+        for r in dataframe_to_rows(df_dict[sheet], index=include_index, header=include_column):
+            workbook[sheet].append([None if value is pd.NA else value for value in r]) # Int64/boolean 등의 결측값은 빈 cell
+    save_excel(workbook,file_path,include_index,include_column,compression,compress_level)
+
+def _column_to_cell_values(series):
+    """ DataFrame의 열 하나를 Excel cell에 쓸 수 있는 python 값 list로 변환 (결측값은 None)
+
+    Args:
+        series (pandas.Series): 변환할 열
+
+    Returns:
+        list
+
+    """
+    if isinstance(series.dtype, np.dtype): # Int64/boolean 등 확장 dtype은 pd.NA를 가질 수 있으므로 제외
+        if series.dtype.kind in 'iub': # numpy 정수/bool 열은 결측값이 없으므로 바로 변환
+            return series.tolist()
+        if series.dtype.kind == 'f' and not series.isna().any():
+            return series.tolist()
+    return series.astype(object).where(series.notna(), None).tolist()
+
+def _iter_df_rows(df, include_index=False, include_column=False, chunk_size=default_chunk_size):
+    """ DataFrame을 Excel에 append할 행 단위로 반환
+
+    chunk_size 행씩 잘라 열 단위로 한 번에 python 값으로 변환한 뒤 행으로 묶는다.
+
+    Args:
+        df (pandas.DataFrame): 저장할 DataFrame
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        chunk_size (int, optional): 한 번에 변환할 최대 행 수
+
+    Yields:
+        tuple: Excel 한 행의 값
+
+    """
+    if include_column:
+        header = df.columns.tolist()
+        yield tuple([df.index.name] + header if include_index else header)
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        columns = [_column_to_cell_values(chunk.iloc[:, i]) for i in range(chunk.shape[1])]
+        if include_index:
+            columns.insert(0, _column_to_cell_values(chunk.index.to_series()))
+        yield from zip(*columns)
+
+def _measure_df_streamed(result, df_dict, sheet_name=["Sheet"], file_path=None, *args, **kwargs):
+    return _measure_df_written(result, df_dict, None, sheet_name, file_path)
+
+@profiletool.instrument(measure=_measure_df_streamed)
+def stream_df_to_excel(df_dict, sheet_name=["Sheet"], file_path=None, include_index=False, include_column=False, chunk_size=default_chunk_size,
+                       compression=None, compress_level=None):
+    """ DataFrame를 write-only Workbook을 통해 새 Excel 파일로 바로 저장
+
+    write-only Workbook은 append한 행을 즉시 임시파일로 기록하고 Cell 객체를 유지하지 않으므로
+    수십만 행을 저장해도 메모리 사용량이 일정하고 save_df_to_excel보다 훨씬 빠르다.
+    기존 파일에 이어 쓰는 것은 불가하며 file_path에 항상 새 파일을 만든다.
+    lxml이 설치되어 있으면 openpyxl이 XML을 더 빠르게 기록한다. (pip install lxml)
+
+    Args:
+        df_dict (dict): key:pandas.DataFrame
+        sheet_name (list, optional): 저장할 Excel Workbook sheet 이름
+        file_path (str, optional): 저장 위치 (C:\\Users\\...), 입력하지 않을 시 Default로 들어감.
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        chunk_size (int, optional): 한 번에 변환할 최대 행 수
+        compression (str, optional): zip 압축 방식. save_excel 참고
+        compress_level (int, optional): deflate 압축 수준. save_excel 참고
+
+    """
+    _resolve_compression(compression, compress_level) # 행을 기록하기 전에 옵션 확인
+    workbook = openpyxl.Workbook(write_only=True)
+    for sheet in sheet_name:
+        worksheet = workbook.create_sheet(title=sheet)
+        with profiletool.span('write_rows'):
+            for r in _iter_df_rows(df_dict[sheet], include_index, include_column, chunk_size):
+                worksheet.append(r)
+    save_excel(workbook,file_path,include_index,include_column,compression,compress_level)
+
+
+def _collect_sheet_strings(df, include_index=False, include_column=False):
+    """ DataFrame을 Excel에 쓸 때 문자열 cell이 되는 값을 중복 없이 모음 (_render_row_xml과 같은 기준)
+
+    Args:
+        df (pandas.DataFrame): 저장할 DataFrame
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+
+    Returns:
+        list (str)
+
+    """
+    def is_string_cell(value):
+        return value is not None and not isinstance(value, (bool, int, float, datetime.datetime, datetime.date)) and not pd.isna(value)
+
+    values = []
+    if include_column:
+        values.extend([df.index.name] + df.columns.tolist() if include_index else df.columns.tolist())
+    columns = [df.iloc[:, i] for i in range(df.shape[1])]
+    if include_index:
+        columns.append(df.index.to_series())
+    for column in columns:
+        if column.dtype.kind in 'iufbmM': # 숫자/bool/날짜 열에는 문자열이 없다
+            continue
+        values.extend(pd.unique(column.astype(object)).tolist())
+    return list(dict.fromkeys(str(value) for value in values if is_string_cell(value)))
+
+def _render_sheet_part(df, part_path, include_index=False, include_column=False, string_codes=None, chunk_size=default_chunk_size):
+    """ 별도 프로세스에서 DataFrame 하나를 Sheet XML로 만들어 part_path 파일에 기록
+
+    문자열은 string_codes의 공유 문자열표 번호로 기록하며, 날짜는 PARALLEL_DATE_STYLE style을 사용한다.
+
+    Args:
+        df (pandas.DataFrame): 저장할 DataFrame
+        part_path (str): Sheet XML을 기록할 임시 파일 경로
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        string_codes (dict, optional): 문자열 : 공유 문자열표 번호
+        chunk_size (int, optional): 한 번에 변환할 최대 행 수
+
+    """
+    from openpyxl.utils.cell import get_column_letter
+    rows = len(df) + bool(include_column)
+    columns = df.shape[1] + bool(include_index)
+    dimension = f'A1:{get_column_letter(max(columns, 1))}{max(rows, 1)}'
+    with open(part_path, 'wb') as part:
+        part.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{SHEET_MAIN_NS[1:-1]}">'
+                   f'<dimension ref="{dimension}"/><sheetData>'.encode('utf8'))
+        for row_number, values in enumerate(_iter_df_rows(df, include_index, include_column, chunk_size), 1):
+            part.write(_render_row_xml(row_number, values, PARALLEL_DATE_STYLE, string_codes))
+        part.write(b'</sheetData></worksheet>')
+
+def _write_xlsx_package(file_path, sheets, strings, compression=None, compress_level=None):
+    """ Sheet XML 파일들과 공유 문자열표로 최소 구성의 xlsx 압축파일을 만듦
+
+    Args:
+        file_path (str): 저장 위치
+        sheets (list): (Sheet명, Sheet XML 파일 경로) 목록
+        strings (list): 공유 문자열표
+        compression (str, optional): zip 압축 방식. save_excel 참고
+        compress_level (int, optional): deflate 압축 수준. save_excel 참고
+
+    """
+    from xml.sax.saxutils import escape # import 시 urllib/http를 불러오므로 사용할 때 import
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    content_types = ''.join(f'<Override PartName="/xl/worksheets/sheet{number}.xml" '
+                            f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                            for number in range(1, len(sheets) + 1))
+    names = [escape(name, {'"': '&quot;'}) for name, _ in sheets]
+    workbook_sheets = ''.join(f'<sheet name="{name}" sheetId="{number}" r:id="rId{number}"/>' for number, name in enumerate(names, 1))
+    workbook_rels = ''.join(f'<Relationship Id="rId{number}" Target="worksheets/sheet{number}.xml" '
+                            f'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+                            for number in range(1, len(sheets) + 1))
+    header = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    method, level = _resolve_compression(compression, compress_level)
+    with zipfile.ZipFile(file_path, 'w', method, allowZip64=True, compresslevel=level) as archive:
+        archive.writestr('[Content_Types].xml', header +
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            f'{content_types}</Types>')
+        archive.writestr('_rels/.rels', header +
+            f'<Relationships xmlns="{PKG_REL_NS[1:-1]}">'
+            '<Relationship Id="rId1" Target="xl/workbook.xml" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/></Relationships>')
+        archive.writestr('xl/workbook.xml', header +
+            f'<workbook xmlns="{SHEET_MAIN_NS[1:-1]}" xmlns:r="{DOC_REL_NS[1:-1]}"><sheets>{workbook_sheets}</sheets></workbook>')
+        archive.writestr('xl/_rels/workbook.xml.rels', header +
+            f'<Relationships xmlns="{PKG_REL_NS[1:-1]}">{workbook_rels}'
+            f'<Relationship Id="rId{len(sheets) + 1}" Target="styles.xml" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"/>'
+            f'<Relationship Id="rId{len(sheets) + 2}" Target="sharedStrings.xml" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings"/></Relationships>')
+        archive.writestr('xl/styles.xml', header +
+            f'<styleSheet xmlns="{SHEET_MAIN_NS[1:-1]}">'
+            '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd h:mm:ss"/></numFmts>'
+            '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+            '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+            '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles></styleSheet>')
+        with archive.open('xl/sharedStrings.xml', 'w') as part:
+            part.write(f'{header}<sst xmlns="{SHEET_MAIN_NS[1:-1]}" uniqueCount="{len(strings)}">'.encode('utf8'))
+            for text in strings:
+                part.write(f'<si><t xml:space="preserve">{escape(ILLEGAL_CHARACTERS_RE.sub("", text))}</t></si>'.encode('utf8'))
+            part.write(b'</sst>')
+        for number, (_, part_path) in enumerate(sheets, 1):
+            archive.write(part_path, f'xl/worksheets/sheet{number}.xml')
+
+def _measure_df_parallel(result, df_dict, sheet_name=["Sheet"], file_path=None, *args, **kwargs):
+    return _measure_df_written(result, df_dict, None, sheet_name, file_path)
+
+@profiletool.instrument(measure=_measure_df_parallel)
+def parallel_df_to_excel(df_dict, sheet_name=["Sheet"], file_path=None, include_index=False, include_column=False, workers=4, chunk_size=default_chunk_size,
+                         compression=None, compress_level=None):
+    """ 여러 DataFrame을 Sheet마다 별도 프로세스에서 XML로 만들어 새 Excel 파일 하나로 저장
+
+    Sheet XML은 서로 독립적이므로 Sheet 수가 많은 보고서는 저장 시간이 CPU core 수에 비례해 줄어든다.
+    먼저 Sheet별 문자열을 모아 공유 문자열표 하나로 합친 뒤 각 프로세스가 최종 번호로 Sheet XML을 기록하므로
+    다시 번호를 고쳐 쓰는 과정이 없다. 압축파일 조립(압축)은 현재 프로세스에서 한다.
+    서식 없이 값만 기록하며 날짜는 yyyy-mm-dd h:mm:ss 형식이다. 기존 파일에 이어 쓰는 것은 불가하다.
+    (Windows에서는 호출부를 if __name__ == "__main__": 아래에 두어야 한다.)
+
+    Args:
+        df_dict (dict): key:pandas.DataFrame
+        sheet_name (list, optional): 저장할 Excel Workbook sheet 이름 (저장 순서)
+        file_path (str, optional): 저장 위치 (C:\\Users\\...), 입력하지 않을 시 Default로 들어감.
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        workers (int, optional): 동시에 사용할 최대 프로세스 수
+        chunk_size (int, optional): 한 번에 변환할 최대 행 수
+        compression (str, optional): zip 압축 방식. save_excel 참고
+        compress_level (int, optional): deflate 압축 수준. save_excel 참고
+
+    Raises:
+        ValueError: Sheet명이 Excel에서 사용할 수 없는 이름이거나 compression, compress_level이 잘못된 경우
+
+    """
+    _resolve_compression(compression, compress_level)
+    for sheet in sheet_name:
+        if not sheet or len(sheet) > 31 or re.search(r'[\\*?:/\[\]]', sheet):
+            raise ValueError(f"[Error] {sheet} is not a valid sheet name")
+    if file_path is None: # 파일 경로를 따로 주지 않은 경우
+        file_path = default_save_path
+    with profiletool.span('collect_strings'):
+        sheet_strings = [_collect_sheet_strings(df_dict[sheet], include_index, include_column) for sheet in sheet_name]
+        codes = dict()
+        for strings in sheet_strings:
+            for text in strings:
+                codes.setdefault(text, len(codes))
+    temp_directory = tempfile.mkdtemp(prefix='pyexceltool_')
+    try:
+        part_paths = [os.path.join(temp_directory, f'sheet{number}.xml') for number in range(1, len(sheet_name) + 1)]
+        with profiletool.span('render_sheets'):
+            with ProcessPoolExecutor(max_workers=max(1, min(workers, len(sheet_name)))) as executor:
+                futures = [executor.submit(_render_sheet_part, df_dict[sheet], part_path, include_index, include_column,
+                                           {text: codes[text] for text in strings}, chunk_size)
+                           for sheet, part_path, strings in zip(sheet_name, part_paths, sheet_strings)]
+                for future in futures:
+                    future.result()
+        with profiletool.span('write_package'):
+            try:
+                _write_xlsx_package(file_path, list(zip(sheet_name, part_paths)), list(codes), compression, compress_level)
+            except FileNotFoundError:
+                print('[Error] Excel file not found. check the file path')
+            except PermissionError:
+                print('[Error] Excel file is open or the same file name exists.')
+    finally:
+        shutil.rmtree(temp_directory, ignore_errors=True)
+
+
+def _read_date_styles(archive):
+    """ styles.xml에서 날짜 표시 형식을 가진 cell style(xf) 번호를 모두 찾음
+
+    Args:
+        archive (zipfile.ZipFile): xlsx 압축파일
+
+    Returns:
+        list (int) : 날짜 형식 style 번호 (오름차순)
+
+    """
+    from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+    try:
+        root = ET.fromstring(archive.read('xl/styles.xml'))
+    except KeyError:
+        return []
+    formats = {int(fmt.get('numFmtId')): fmt.get('formatCode') for fmt in root.iter(f'{SHEET_MAIN_NS}numFmt')}
+    cell_xfs = root.find(f'{SHEET_MAIN_NS}cellXfs')
+    if cell_xfs is None:
+        return []
+    date_styles = []
+    for position, xf in enumerate(cell_xfs.iter(f'{SHEET_MAIN_NS}xf')):
+        format_id = int(xf.get('numFmtId', 0))
+        format_code = formats.get(format_id, BUILTIN_FORMATS.get(format_id))
+        if format_code is not None and is_date_format(format_code):
+            date_styles.append(position)
+    return date_styles
+
+def _find_date_style(archive):
+    """ styles.xml에서 날짜 표시 형식을 가진 cell style(xf) 번호를 찾음
+
+    Args:
+        archive (zipfile.ZipFile): xlsx 압축파일
+
+    Returns:
+        int or None : 날짜 형식 style 번호. 없으면 None
+
+    """
+    date_styles = _read_date_styles(archive)
+    return date_styles[0] if date_styles else None
+
+def _render_row_xml(row_number, values, date_style=None, string_codes=None):
+    """ 행 값을 Sheet XML의 <row> 요소로 변환 (문자열은 공유 문자열표를 건드리지 않도록 inline string 사용)
+
+    Args:
+        row_number (int): Excel 행 번호 (1부터)
+        values (tuple): 행의 값
+        date_style (int, optional): 날짜에 사용할 cell style 번호. 없으면 날짜는 ISO 문자열로 기록
+        string_codes (dict, optional): 문자열 : 공유 문자열표 번호. 있는 문자열은 inline string 대신 번호로 기록
+
+    Returns:
+        bytes
+
+    """
+    from xml.sax.saxutils import escape
+    from openpyxl.utils.cell import get_column_letter
+    from openpyxl.utils.datetime import to_excel
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    cells = []
+    for col_idx, value in enumerate(values, 1):
+        if value is None:
+            continue
+        ref = f'{get_column_letter(col_idx)}{row_number}'
+        if isinstance(value, bool):
+            cells.append(f'<c r="{ref}" t="b"><v>{int(value)}</v></c>')
+        elif isinstance(value, (int, float)):
+            cells.append(f'<c r="{ref}"><v>{value!r}</v></c>')
+        elif isinstance(value, (datetime.datetime, datetime.date)) and date_style is not None:
+            cells.append(f'<c r="{ref}" s="{date_style}"><v>{to_excel(value)!r}</v></c>')
+        else:
+            if isinstance(value, (datetime.datetime, datetime.date)):
+                value = value.isoformat()
+            code = string_codes.get(str(value)) if string_codes is not None else None
+            if code is not None:
+                cells.append(f'<c r="{ref}" t="s"><v>{code}</v></c>')
+                continue
+            text = escape(ILLEGAL_CHARACTERS_RE.sub('', str(value)))
+            cells.append(f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return f'<row r="{row_number}">{"".join(cells)}</row>'.encode('utf8')
+
+def _copy_zip_entry_raw(source_file, target, item):
+    """ source_file(zip 파일 객체)의 item을 압축을 풀지 않고 압축된 byte 그대로 target(ZipFile)에 추가
+
+    zipfile에는 압축된 byte를 그대로 복사하는 공개 API가 없으므로 ZipFile.writestr과 같은 방식으로
+    local header와 data를 직접 기록하고 central directory 목록에 등록한다.
+    """
+    import struct, copy
+    source_file.seek(item.header_offset)
+    header = source_file.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    source_file.seek(item.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+    raw = source_file.read(item.compress_size)
+    info = copy.copy(item)
+    info.flag_bits &= ~0x08 # 크기/CRC를 header에 기록하므로 data descriptor는 사용하지 않음
+    info.header_offset = target.fp.tell()
+    target.fp.write(info.FileHeader())
+    target.fp.write(raw)
+    target.filelist.append(info)
+    target.NameToInfo[info.filename] = info
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+def _rewrite_archive_part(file_path, part, data, drop_calc_chain=False):
+    """ xlsx 압축파일에서 part 하나만 data로 바꾸고 나머지 part는 압축된 byte 그대로 복사하여 파일을 교체
+
+    바꾸지 않는 part(다른 Sheet 등)는 압축을 풀거나 다시 압축하지 않으므로 파일 크기 대신 바뀐 part 크기에 비례하여 시간이 걸린다.
+    (바뀐 part와 calcChain을 지우며 고치는 [Content_Types].xml, workbook.xml.rels만 다시 압축한다.)
+
+    Args:
+        file_path (str): xlsx 파일 경로
+        part (str): 교체할 archive 내부 경로
+        data (bytes): 새 part 내용
+        drop_calc_chain (bool, optional): 수식 계산 순서(calcChain.xml)를 제거할지 여부.
+            수식이 있던 cell을 바꾼 경우 Excel이 열 때 다시 계산하도록 제거한다.
+
+    """
+    temp_file = tempfile.NamedTemporaryFile(dir=os.path.dirname(file_path), suffix='.xlsx', delete=False)
+    temp_file.close()
+    try:
+        with open(file_path, 'rb') as source_file, zipfile.ZipFile(source_file) as source, \
+                zipfile.ZipFile(temp_file.name, 'w', allowZip64=True) as target:
+            for item in source.infolist():
+                if drop_calc_chain and item.filename == 'xl/calcChain.xml':
+                    continue
+                if item.filename == part:
+                    target.writestr(item, data)
+                elif drop_calc_chain and item.filename in ('[Content_Types].xml', 'xl/_rels/workbook.xml.rels'):
+                    target.writestr(item, re.sub(rb'<(Override|Relationship)\b[^>]*calcChain[^>]*/>', b'', source.read(item.filename)))
+                else:
+                    _copy_zip_entry_raw(source_file, target, item)
+        os.replace(temp_file.name, file_path)
+    except BaseException:
+        os.remove(temp_file.name)
+        raise
+
+def sync_df_to_excel(df, file_path, sheet_name='Sheet', key_columns=None, include_index=False, include_column=False):
+    """ 기존 Excel 파일의 Sheet와 DataFrame을 비교하여 새 행/변경된 행만 반영
+
+    Workbook 전체를 다시 저장하지 않고 대상 Sheet의 XML part만 고쳐 쓰며,
+    다른 Sheet와 공유 문자열표 등 나머지 part는 압축을 풀지 않고 그대로 복사한다.
+    key_columns를 지정하면 key가 같은 기존 행의 값이 다를 때 그 행을 교체하고 없는 key의 행은 끝에 추가한다.
+    key_columns가 없으면 기존 Sheet에 완전히 같은 행이 없는 행만 끝에 추가한다.
+    Sheet가 비어있고 include_column이면 header를 먼저 기록하며, 기존 Sheet의 0번 행은 header로 간주한다.
+
+    Note:
+        새로 기록/교체한 행의 cell 서식은 유지되지 않는다. 문자열은 inline string으로 기록하며,
+        날짜는 파일에 날짜 서식이 있으면 그 서식을, 없으면 ISO 문자열로 기록한다.
+
+    Args:
+        df (pandas.DataFrame): 저장할 DataFrame
+        file_path (str): 대상 Excel 파일 경로. 입력하지 않을 시 Default
+        sheet_name (str, optional): 대상 Sheet명
+        key_columns (list, optional): 같은 행을 판단할 key 열 이름 목록
+        include_index (bool, optional): index 포함여부 (index는 0번 열)
+        include_column (bool, optional): column(header) 포함여부
+
+    Returns:
+        dict (appended : 추가한 행 수, updated : 교체한 행 수)
+
+    Raises:
+        ValueError: 파일이나 Sheet가 없는 경우, Sheet XML 형식을 지원하지 않는 경우
+
+    """
+    if file_path is None:
+        file_path = default_save_path
+    if not os.path.exists(file_path):
+        raise ValueError("[Error] Can't find the file from the given file path")
+    with zipfile.ZipFile(file_path) as archive:
+        part = _read_workbook_manifest(archive).get(sheet_name)
+        if part is None:
+            raise ValueError(f"[Error] {sheet_name} is not exist")
+        sheet_xml = archive.read(part)
+        date_style = _find_date_style(archive)
+    if b'<sheetData' not in sheet_xml:
+        raise ValueError("[Error] Not supported worksheet xml format")
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        existing = [(row_number, row) for row_number, row in enumerate(workbook[sheet_name].iter_rows(values_only=True), 1)
+                    if any(value is not None for value in row)]
+    finally:
+        workbook.close()
+
+    def normalize(row):
+        row = list(row)
+        while row and row[-1] is None: # Excel에서 읽은 행은 빈 cell로 끝날 수 있음
+            row.pop()
+        return tuple(row)
+
+    rows = _iter_df_rows(df, include_index, include_column)
+    if include_column:
+        header = next(rows)
+        if existing:
+            existing = existing[1:]
+    if key_columns is not None:
+        columns = ([df.index.name] if include_index else []) + df.columns.tolist()
+        key_positions = [columns.index(column) for column in key_columns]
+        def make_key(row):
+            return tuple(row[position] if position < len(row) else None for position in key_positions)
+        existing_rows = {make_key(row): (row_number, normalize(row)) for row_number, row in existing}
+    else:
+        existing_rows = {normalize(row) for _, row in existing}
+
+    appended, updated = [], dict()
+    for row in rows:
+        row = normalize(row)
+        if key_columns is None:
+            if row not in existing_rows:
+                appended.append(row)
+            continue
+        found = existing_rows.get(make_key(row))
+        if found is None:
+            appended.append(row)
+        elif found[1] != row:
+            updated[found[0]] = row
+    if not appended and not updated:
+        return {'appended': 0, 'updated': 0}
+
+    row_numbers = [int(number) for number in ROW_NUMBER_RE.findall(b''.join(re.findall(rb'<row\b[^>]*>', sheet_xml)))]
+    last_row = max(row_numbers, default=0)
+    has_formula = False
+    if updated:
+        def replace_row(match):
+            nonlocal has_formula
+            number = ROW_NUMBER_RE.search(match.group(0).split(b'>', 1)[0])
+            if number is None or int(number.group(1)) not in updated:
+                return match.group(0)
+            has_formula = has_formula or b'<f' in match.group(0)
+            return _render_row_xml(int(number.group(1)), updated[int(number.group(1))], date_style)
+        sheet_xml = ROW_XML_RE.sub(replace_row, sheet_xml)
+
+    new_rows = []
+    if include_column and not existing and last_row == 0:
+        new_rows.append(header)
+    new_rows.extend(appended)
+    appended_xml = b''.join(_render_row_xml(last_row + offset, row, date_style) for offset, row in enumerate(new_rows, 1))
+    if b'<sheetData/>' in sheet_xml:
+        sheet_xml = sheet_xml.replace(b'<sheetData/>', b'<sheetData>' + appended_xml + b'</sheetData>', 1)
+    else:
+        sheet_xml = sheet_xml.replace(b'</sheetData>', appended_xml + b'</sheetData>', 1)
+
+    max_row = last_row + len(new_rows)
+    max_col = max([len(row) for row in new_rows + list(updated.values())] + [1])
+    dimension = re.search(rb'<dimension ref="[A-Z]+\d+(?::([A-Z]+)\d+)?"', sheet_xml)
+    if dimension is not None:
+        from openpyxl.utils.cell import column_index_from_string, get_column_letter
+        old_col = column_index_from_string(dimension.group(1).decode()) if dimension.group(1) else 1
+        ref = f'A1:{get_column_letter(max(old_col, max_col))}{max(max_row, 1)}'.encode()
+        sheet_xml = sheet_xml[:dimension.start()] + b'<dimension ref="' + ref + b'"' + sheet_xml[dimension.end():]
+
+    _rewrite_archive_part(file_path, part, sheet_xml, drop_calc_chain=has_formula)
+    return {'appended': len(appended), 'updated': len(updated)}
+
+def get_async_executor():
+    """ async 함수가 사용하는 thread pool 반환 (처음 호출 시 async_max_workers 크기로 생성)
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor
+
+    """
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(max_workers=async_max_workers, thread_name_prefix='pyexceltool')
+        return _async_executor
+
+def shutdown_async_executor(wait=True):
+    """ async 함수가 사용하는 thread pool 종료 (다음 호출 시 async_max_workers 값으로 다시 생성)
+
+    Args:
+        wait (bool, optional): 실행 중인 작업이 끝날 때까지 기다릴지 여부
+
+    """
+    global _async_executor
+    with _async_executor_lock:
+        executor, _async_executor = _async_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+def _get_async_semaphore(loop):
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _async_semaphores[loop] = asyncio.Semaphore(async_max_concurrency)
+    return semaphore
+
+async def _run_blocking(func, *args, timeout=None, cancel_event=None, **kwargs):
+    """ 오래 걸리는 함수를 thread pool에서 실행하고 결과를 기다림
+
+    event loop 하나에서 동시에 실행되는 작업은 async_max_concurrency개로 제한되며, 순서를 기다리는 시간도 timeout에 포함된다.
+    취소되거나 timeout이 지나면 cancel_event를 set 하여 작업이 중간에 멈출 수 있게 한다.
+
+    Args:
+        func (callable): 실행할 함수
+        timeout (float, optional): 최대 대기 시간(초). None이면 제한 없음
+        cancel_event (threading.Event, optional): 취소/timeout 시 set 할 event
+
+    Returns:
+        func의 반환값
+
+    Raises:
+        asyncio.TimeoutError: timeout 안에 끝나지 않은 경우
+        asyncio.CancelledError: 호출한 task가 취소된 경우
+
+    """
+    loop = asyncio.get_running_loop()
+
+    async def run():
+        async with _get_async_semaphore(loop):
+            return await loop.run_in_executor(get_async_executor(), functools.partial(func, *args, **kwargs))
+
+    try:
+        return await asyncio.wait_for(run(), timeout)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        if cancel_event is not None:
+            cancel_event.set()
+        raise
+
+async def load_workbook_with_path_async(file_path, read_only=False, use_cache=False, lazy=False, timeout=None):
+    """ load_workbook_with_path를 thread pool에서 실행하는 async 버전
+
+    Workbook 파싱 중에는 중단할 수 없으므로 취소/timeout 시 결과만 버려진다.
+
+    Args:
+        file_path (str): 읽어올 Excel 파일의 경로
+        read_only (bool, optional): 읽기 전용(streaming) 모드 여부
+        use_cache (bool, optional): 파싱한 Workbook 재사용 여부
+        lazy (bool, optional): Sheet를 처음 접근할 때 파싱할지 여부
+        timeout (float, optional): 최대 대기 시간(초). None이면 제한 없음
+
+    Returns:
+        openpyxl.Workbook
+
+    Raises:
+        asyncio.TimeoutError: timeout 안에 끝나지 않은 경우
+
+    """
+    return await _run_blocking(load_workbook_with_path, file_path, read_only, use_cache, lazy, timeout=timeout)
+
+def _convert_worksheet_cancellable(workbook, sheet_name, include_index, include_column, chunk_size, options, cancel_event):
+    if isinstance(workbook, str):
+        workbook = load_workbook_with_path(workbook, read_only=True)
+        try:
+            return _convert_worksheet_cancellable(workbook, sheet_name, include_index, include_column, chunk_size, options, cancel_event)
+        finally:
+            workbook.close()
+    dfs = _convert_sheets_sequential(workbook, sheet_name, include_index, include_column, chunk_size, options, cancel_event)
+    if not dfs:
+        raise ValueError(f"All {sheet_name} is not exist")
+    return dfs
+
+async def convert_worksheet_to_df_async(workbook, sheet_name=['Sheet'], include_index=False, include_column=False, chunk_size=default_chunk_size, workers=None,
+                                        dtype=None, column_list=None, start_row=0, end_row=None, cell_range=None, row_filter=None, timeout=None):
+    """ convert_worksheet_to_df를 thread pool에서 실행하는 async 버전
+
+    취소되거나 timeout이 지나면 다음 chunk를 읽기 전에 변환을 멈추므로 thread가 계속 점유되지 않는다.
+    (workers를 지정한 경우 프로세스에서 진행 중인 변환은 끝까지 실행되고 결과만 버려진다.)
+    openpyxl Workbook은 여러 thread에서 동시에 읽을 수 없으므로 동시에 여러 변환을 실행할 때는 Workbook 대신 파일 경로를 넘겨라.
+
+    Args:
+        workbook (openpyxl.Workbook or str): load_workbook_with_path로 가져온 Workbook 또는 Excel 파일 경로
+        sheet_name (list): Excel Workbook의 Sheet명
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        chunk_size (int, optional): 한 번에 DataFrame으로 변환할 최대 행 수 (취소를 확인하는 단위)
+        workers (int, optional): 병렬 변환에 사용할 최대 프로세스 수. None이면 thread pool에서 순차 변환
+        dtype, column_list, start_row, end_row, cell_range, row_filter: convert_worksheet_to_df 참고
+        timeout (float, optional): 최대 대기 시간(초). None이면 제한 없음
+
+    Returns:
+        dict (sheet_name : pandas.DataFrame)
+
+    Raises:
+        ValueError: 입력받은 모든 sheet_name이 Workbook에 존재하지 않는 경우
+        asyncio.TimeoutError: timeout 안에 끝나지 않은 경우
+
+    """
+    options = dict(dtype=dtype, column_list=column_list, start_row=start_row, end_row=end_row, cell_range=cell_range, row_filter=row_filter)
+    if workers is not None:
+        return await _run_blocking(convert_worksheet_to_df, workbook, sheet_name, include_index, include_column, chunk_size, workers,
+                                   timeout=timeout, **options)
+    cancel_event = threading.Event()
+    return await _run_blocking(_convert_worksheet_cancellable, workbook, sheet_name, include_index, include_column, chunk_size, options, cancel_event,
+                               timeout=timeout, cancel_event=cancel_event)
+
+async def save_excel_async(workbook, file_path=None, include_index=False, include_column=False, timeout=None, compression=None, compress_level=None):
+    """ save_excel을 thread pool에서 실행하는 async 버전
+
+    저장 중에는 중단할 수 없으므로 취소/timeout 후에도 진행 중인 저장은 끝까지 실행된다.
+
+    Args:
+        workbook (openpyxl.Workbook): 저장할 Excel Workbook 객체
+        file_path (str, optional): 저장 위치 (C:\\Users\\...), 입력하지 않을 시 Default로 들어감.
+        include_index (bool, optional): index 포함여부
+        include_column (bool, optional): column(header) 포함여부
+        timeout (float, optional): 최대 대기 시간(초). None이면 제한 없음
+        compression (str, optional): zip 압축 방식. save_excel 참고
+        compress_level (int, optional): deflate 압축 수준. save_excel 참고
+
+    Raises:
+        asyncio.TimeoutError: timeout 안에 끝나지 않은 경우
+
+    """
+    await _run_blocking(save_excel, workbook, file_path, include_index, include_column, compression, compress_level, timeout=timeout)
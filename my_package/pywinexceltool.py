@@ -90,13 +90,14 @@ finally: import openpyxl
 
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+import reporttool # output.txt는 처음 기록할 때 연다 (sys.stdout은 바꾸지 않음)
+
 ### Option Setting
 pd.set_option('display.max_row', True)
 pd.set_option('display.max_columns', None)  # 터미널 화면에 축약없이 전체내용 출력
 pd.set_option('display.max_colwidth', None)
 pd.set_option('display.width', None)
 pd.set_option('display.date_yearfirst',True)
-sys.stdout = open('output.txt', "w", encoding='utf8') # 한글 안깨지게 불러오기
 
 ### Global Value
 current_time = datetime.datetime.today()
@@ -112,7 +113,7 @@ def show_worksheet_list(workbook):
 
     """
     workbook_sheet_list =  [sheet.Name for sheet in workbook.Sheets]
-    print(f'''workbook_sheet_list = {workbook_sheet_list}''')
+    reporttool.get_report_writer().write_line(f'''workbook_sheet_list = {workbook_sheet_list}''')
 
 def create_new_excel_object():
     """ 새로운 Excel 객체를 생성하여 반환
@@ -232,14 +233,14 @@ def save_excel(excel, workbook, file_path=None, include_index=False, include_col
     try :
         if file_path is None: # 파일 경로를 따로 주지 않은 경우
             file_path = default_save_path
-            print(f'[Warning] file_path is not entered. file is saved in default path: {default_save_path}')
+            reporttool.get_report_writer().write_line(f'[Warning] file_path is not entered. file is saved in default path: {default_save_path}')
         excel.SaveAs(file_path)
         workbook.Close()
         excel.Quit()
     except FileNotFoundError:
-        print('[Error] Excel file not found. check the file path')
+        reporttool.get_report_writer().write_line('[Error] Excel file not found. check the file path')
     except PermissionError:
-        print('[Error] Excel file is open or the same file name exists.')
+        reporttool.get_report_writer().write_line('[Error] Excel file is open or the same file name exists.')
 
 def save_df_to_excel(df_dict, excel, workbook, sheet_name=["Sheet"], file_path=None, include_index=False, include_column=False):
     """ DataFrame를 Excel 파일에 저장
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+#-*- coding: utf-8 -*-
+"""요약 정보와 DataFrame 내용을 파일에 기록하는 라이브러리
+   ※ 본 문서는 Google Style Python docstring 으로 작성됨
+
+   sys.stdout을 바꾸지 않고 ReportWriter를 통해 output.txt 등에 기록한다.
+   큰 버퍼로 모아서 기록하고, background=True이면 별도 thread에서 기록하므로 작업 시간에 거의 영향을 주지 않는다.
+   DataFrame은 한 행씩 문자열로 만들어 기록하며 max_rows, max_items, max_cell_chars로 출력량을 제한한다.
+
+   아래의 기능을 제공한다.
+   기본 ReportWriter(output.txt) 가져오기/교체
+   문자열 한 줄 기록
+   DataFrame 요약(header, index 일부) 기록
+   DataFrame 내용을 처음/끝 일부 또는 균등 sampling하여 기록
+
+Example:
+   import reporttool.py
+
+   report = get_report_writer()        # 기본 output.txt, 한글 깨지지 않도록 utf8로 기록
+   report.write_line('시작')
+   report.write_dataframe(df, max_rows=20)
+   report.write_dataframe(df, max_rows=100, sample=True)
+
+   별도 thread에서 기록하는 writer로 교체
+   set_report_writer(ReportWriter('report.txt', background=True))
+
+
+
+"""
+
+import io, atexit, threading, queue
+from lazyimport import lazy_import
+np = lazy_import('numpy')
+
+### Global Value
+default_report_path = 'output.txt'
+default_buffer_size = 1024 * 1024 # 1MB 단위로 모아서 기록
+default_max_rows = 60             # write_dataframe 기본 최대 행 수
+default_max_items = 50            # 요약에서 보여줄 header/index 최대 개수
+default_max_cell_chars = 100      # cell 하나의 최대 출력 글자 수
+_report_writer = None
+_report_writer_lock = threading.Lock()
+
+def _truncate(text, max_chars):
+    text = str(text)
+    return text if max_chars is None or len(text) <= max_chars else text[:max_chars - 3] + '...'
+
+def format_items(items, max_items=default_max_items):
+    """ 목록을 앞/뒤 일부만 남겨 문자열로 변환 ([a, b, ..., y, z] (총 n개))
+
+    Args:
+        items (sequence) : 목록 (list, pandas.Index 등)
+        max_items (int, optional) : 보여줄 최대 개수. None이면 전체
+
+    Returns:
+        str
+
+    """
+    count = len(items)
+    if max_items is None or count <= max_items:
+        return f'{list(items)}'
+    head = max_items // 2
+    shown = [repr(item) for item in list(items[:head])] + ['...'] + [repr(item) for item in list(items[count - (max_items - head):])]
+    return f"[{', '.join(shown)}] (총 {count}개)"
+
+class ReportWriter:
+    """ 버퍼를 사용해 파일에 기록하는 출력 객체 (background=True이면 별도 thread에서 기록)
+
+    Args:
+        file_path (str, optional) : 기록할 파일 경로
+        background (bool, optional) : True이면 기록/DataFrame 문자열 변환을 별도 thread에서 수행
+        buffer_size (int, optional) : 파일 버퍼 크기 (byte)
+        max_rows (int, optional) : write_dataframe 기본 최대 행 수
+        max_items (int, optional) : write_dataframe_info의 header/index 최대 개수
+        max_cell_chars (int, optional) : cell 하나의 최대 출력 글자 수
+
+    Attributes:
+        errors (list) : background thread에서 기록 중 발생한 예외 목록 (예외가 나도 이후 기록은 계속 처리)
+
+    """
+    def __init__(self, file_path=default_report_path, background=False, buffer_size=default_buffer_size,
+                 max_rows=default_max_rows, max_items=default_max_items, max_cell_chars=default_max_cell_chars):
+        self.file_path = file_path
+        self.max_rows = max_rows
+        self.max_items = max_items
+        self.max_cell_chars = max_cell_chars
+        self._file = io.open(file_path, 'w', encoding='utf8', buffering=buffer_size) # 한글 안깨지게 utf8
+        self._queue = None
+        self._thread = None
+        self.errors = []
+        if background:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._run, name='ReportWriter', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                task()
+            except Exception as err: # thread가 멈추면 flush가 끝나지 않으므로 기록하고 계속 처리
+                self.errors.append(err)
+            finally:
+                self._queue.task_done()
+
+    def _submit(self, task):
+        if self._queue is None:
+            task()
+        else:
+            self._queue.put(task)
+
+    def write(self, text):
+        """ 문자열을 그대로 기록
+        """
+        self._submit(lambda: self._file.write(text))
+
+    def write_line(self, text=''):
+        """ 문자열 한 줄 기록
+        """
+        self.write(f'{text}\n')
+
+    def write_dataframe_info(self, df, max_items=None):
+        """ DataFrame의 크기, header, index를 앞/뒤 일부만 요약하여 기록
+
+        Args:
+            df (pandas.DataFrame) : 하나의 DataFrame 객체
+            max_items (int, optional) : 보여줄 header/index 최대 개수. 입력하지 않을 시 writer 설정값
+
+        """
+        max_items = self.max_items if max_items is None else max_items
+        self.write(f'''
+Shape : {df.shape}
+Header : {format_items(df.columns, max_items)}
+index : {format_items(df.index, max_items)}
+''')
+
+    def write_dataframe(self, df, max_rows=None, sample=False):
+        """ DataFrame 내용을 한 행씩 문자열로 변환하여 기록
+
+        max_rows보다 행이 많으면 처음/끝 max_rows//2 행씩만 기록하거나, sample이면 균등한 간격으로 max_rows 행을 고른다.
+        background writer에서는 선택한 행을 복사해 넘기므로 호출 후 df를 수정해도 된다.
+        (max_rows=0이면 제한 없이 전체를 기록하며, 이때는 df를 복사하지 않는다.)
+
+        Args:
+            df (pandas.DataFrame) : 하나의 DataFrame 객체
+            max_rows (int, optional) : 최대 행 수. 입력하지 않을 시 writer 설정값, 0이면 전체
+            sample (bool, optional) : True이면 처음/끝 대신 균등 간격으로 행 선택
+
+        """
+        max_rows = self.max_rows if max_rows is None else max_rows
+        count = len(df)
+        if not max_rows or count <= max_rows:
+            parts = [df]
+        elif sample:
+            parts = [df.iloc[np.linspace(0, count - 1, max_rows).astype(int)]]
+        else:
+            parts = [df.iloc[:max_rows // 2], df.iloc[count - (max_rows - max_rows // 2):]]
+        if self._queue is not None and max_rows:
+            parts = [part.copy() for part in parts]
+        self._submit(lambda: self._write_rows(df.columns, parts, count))
+
+    def _write_rows(self, columns, parts, count):
+        write = self._file.write
+        write('\t'.join(['index'] + [_truncate(column, self.max_cell_chars) for column in columns]) + '\n')
+        for number, part in enumerate(parts):
+            if number > 0:
+                write(f'... ({count - sum(len(p) for p in parts)} rows omitted)\n')
+            for row in part.itertuples(name=None):
+                write('\t'.join(_truncate(value, self.max_cell_chars) for value in row) + '\n')
+        write(f'[{count} rows x {len(columns)} columns]\n')
+
+    def flush(self):
+        """ 대기 중인 기록을 모두 파일에 반영
+        """
+        if self._queue is not None:
+            self._queue.join()
+        self._file.flush()
+
+    def close(self):
+        """ 대기 중인 기록을 마치고 파일을 닫음
+        """
+        if self._file.closed:
+            return
+        if self._queue is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def get_report_writer():
+    """ 기본 ReportWriter 반환 (처음 호출 시 default_report_path 파일을 열고, 프로그램 종료 시 닫음)
+
+    Returns:
+        ReportWriter
+
+    """
+    global _report_writer
+    with _report_writer_lock:
+        if _report_writer is None:
+            _report_writer = ReportWriter()
+            atexit.register(_report_writer.close)
+        return _report_writer
+
+def set_report_writer(writer):
+    """ 기본 ReportWriter를 교체 (기존 writer는 닫음)
+
+    Args:
+        writer (ReportWriter) : 새 기본 writer
+
+    """
+    global _report_writer
+    with _report_writer_lock:
+        if _report_writer is not None and _report_writer is not writer:
+            _report_writer.close()
+        _report_writer = writer
+        atexit.register(writer.close)